@@ -0,0 +1,5 @@
+from conduit.core.exceptions import ConduitError
+
+# Errors a command reports as "Error: ..." before exiting with status 1.
+# Anything else is a bug and propagates with its traceback.
+COMMAND_ERRORS = (ConduitError, ValueError, OSError)
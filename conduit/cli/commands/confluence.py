@@ -1,8 +1,31 @@
+import sys
+
 import click
+from operator import itemgetter
 from typing import Optional
 
-from conduit.platforms.registry import PlatformRegistry
-from conduit.core.exceptions import PlatformError
+from conduit.cli.commands import COMMAND_ERRORS
+from conduit.cli.daemon import invoke
+from conduit.cli.output import emit, emit_records, output_option, to_json
+
+# Pulls both fields of a page in one call in the listing loops
+_title_id = itemgetter("title", "id")
+# Columns for a page in tsv output
+_page_columns = itemgetter("id", "title")
+
+
+def _clean_body(page):
+    body = page.get("body")
+    return body.get("clean", "") if body else None
+
+
+def _storage_body(page):
+    body = page.get("body")
+    return body.get("storage", {}).get("value", "") if body else None
+
+
+# Body text for each pages content format; None when bodies weren't expanded
+_BODY_FORMATTERS = {"clean": _clean_body, "storage": _storage_body, "raw": to_json}
 
 
 @click.group()
@@ -36,28 +59,43 @@ def pages():
 @pages.command()
 @click.argument("space")
 @click.option("--limit", default=10, help="Maximum number of pages to return")
+@output_option
 @click.option("--site", help="Site alias to use for this operation")
-def list(space, limit, site):
+def list(space, limit, output_format, site):
     """List pages in a Confluence space.
 
     Example: conduit confluence pages list SPACE --limit 20 [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("confluence", site_alias=site)
-        platform.connect()
-        pages = platform.get_pages_by_space(space, limit=limit)
-        click.echo(pages)
-    except Exception as e:
+        pages = invoke("confluence", site, "get_pages_by_space", space, limit=limit)
+        if output_format == "human":
+            emit(pages)
+        else:
+            emit_records(pages, output_format, _page_columns)
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @pages.command()
 @click.argument("space")
-@click.option("--format", default="clean", help="Output format: clean, storage, or raw")
+@click.option(
+    "--format",
+    type=click.Choice(_BODY_FORMATTERS),
+    default="clean",
+    help="Output format: clean, storage, or raw",
+)
 @click.option("--depth", default="root", help="Content depth: root, all, or children")
+@click.option(
+    "--expand",
+    default="body.storage",
+    help="Properties to expand; pass an empty value to list page metadata only",
+)
+@click.option(
+    "--no-cache", is_flag=True, help="Always fetch from Confluence, skipping the cache"
+)
 @click.option("--site", help="Site alias to use for this operation")
-def content(space, format, depth, site):
+def content(space, format, depth, expand, no_cache, site):
     """Get content from a Confluence space.
 
     Format options:
@@ -65,67 +103,136 @@ def content(space, format, depth, site):
       • storage: Raw Confluence storage format
       • raw: Unprocessed API response
 
+    With --depth all, results are cached on disk and reused until pages in the
+    space change. Other depths are always fetched from Confluence.
     Example: conduit confluence pages content SPACE --format clean --depth all [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("confluence", site_alias=site)
-        platform.connect()
-        content = platform.get_space_content(space, format=format, depth=depth)
-        click.echo(content)
-    except Exception as e:
+        pages = invoke(
+            "confluence",
+            site,
+            "iter_space_content",
+            space,
+            depth=depth,
+            expand=expand,
+            format="storage" if format == "raw" else format,
+            use_cache=not no_cache,
+        )
+
+        # Pages are printed as each batch arrives rather than after the last one,
+        # with each page's header and body written in a single call
+        format_body = _BODY_FORMATTERS[format]
+        count = 0
+        for page in pages:
+            title, page_id = _title_id(page)
+            header = f"\n=== {title} (ID: {page_id}) ==="
+            text = format_body(page)
+            click.echo(header if text is None else f"{header}\n{text}")
+            count += 1
+
+        click.echo(f"\nFound {count} pages in space {space}")
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @pages.command()
 @click.argument("space_key")
-@click.option("--batch-size", default=100, help="Number of pages to fetch per request")
+@click.option("--batch-size", default=1000, help="Number of pages to fetch per request")
+@click.option(
+    "--no-cache", is_flag=True, help="Always fetch from Confluence, skipping the cache"
+)
+@output_option
 @click.option("--site", help="Site alias to use for this operation")
-def list_all(space_key: str, batch_size: int, site: str):
+def list_all(
+    space_key: str, batch_size: int, no_cache: bool, output_format: str, site: str
+):
     """List all pages in a space using pagination.
 
+    Results are cached on disk and reused until pages in the space change.
     Example: conduit confluence pages list-all SPACE --batch-size 100 [--site site1]
     """
     try:
-        client = PlatformRegistry.get_platform("confluence", site_alias=site)
-        client.connect()
-
-        click.echo(f"Fetching all pages from space {space_key}...")
-        pages = client.get_all_pages_by_space(space_key, batch_size=batch_size)
+        if output_format == "human":
+            click.echo(f"Fetching all pages from space {space_key}...")
+        pages = invoke(
+            "confluence",
+            site,
+            "iter_all_pages_by_space",
+            space_key,
+            batch_size=batch_size,
+            use_cache=not no_cache,
+        )
+
+        if output_format != "human":
+            emit_records(pages, output_format, _page_columns, batch_size)
+            return
 
-        if not pages:
+        # Rows are written once per batch, as each batch arrives
+        count = 0
+        rows = []
+        for title, page_id in map(_title_id, pages):
+            rows.append(f"- {title} (ID: {page_id})")
+            if len(rows) >= batch_size:
+                click.echo("\n".join(rows))
+                count += len(rows)
+                rows.clear()
+        if rows:
+            click.echo("\n".join(rows))
+            count += len(rows)
+
+        if not count:
             click.echo(f"No pages found in space {space_key}")
             return
 
-        click.echo(f"\nFound {len(pages)} pages in space {space_key}:")
-        for page in pages:
-            click.echo(f"- {page['title']} (ID: {page['id']})")
-    except PlatformError as e:
+        click.echo(f"\nFound {count} pages in space {space_key}")
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
 
 
 @pages.command()
-@click.argument("parent_id")
+@click.argument("parent_ids", nargs=-1, required=True)
+@output_option
 @click.option("--site", help="Site alias to use for this operation")
-def children(parent_id: str, site: str):
-    """List all child pages of a parent page.
+def children(parent_ids, output_format: str, site: str):
+    """List all child pages of one or more parent pages.
 
-    Example: conduit confluence pages children PAGE-ID [--site site1]
+    Child pages are fetched with combined searches of up to 100 parents each.
+    Example: conduit confluence pages children PAGE-ID [PAGE-ID ...] [--site site1]
     """
     try:
-        client = PlatformRegistry.get_platform("confluence", site_alias=site)
-        client.connect()
-        pages = client.get_child_pages(parent_id)
-
-        if not pages:
-            click.echo(f"No child pages found for parent {parent_id}")
+        by_parent = invoke("confluence", site, "get_child_pages_bulk", [*parent_ids])
+        results = [by_parent.get(parent_id, []) for parent_id in parent_ids]
+
+        if output_format != "human":
+            emit_records(
+                (
+                    {"parent_id": parent_id, **page}
+                    for parent_id, pages in zip(parent_ids, results)
+                    for page in pages
+                ),
+                output_format,
+                itemgetter("parent_id", "id", "title"),
+            )
             return
 
-        click.echo(f"\nChild pages of {parent_id}:")
-        for page in pages:
-            click.echo(f"- {page['title']} (ID: {page['id']})")
-    except PlatformError as e:
+        for parent_id, pages in zip(parent_ids, results):
+
+            if not pages:
+                click.echo(f"No child pages found for parent {parent_id}")
+                continue
+
+            click.echo(f"\nChild pages of {parent_id}:")
+            click.echo(
+                "\n".join(
+                    f"- {title} (ID: {page_id})"
+                    for title, page_id in map(_title_id, pages)
+                )
+            )
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
 
 
 @pages.command()
@@ -147,24 +254,25 @@ def get(space_key: str, title: str, format: str, site: str):
     Example: conduit confluence pages get SPACE "Page Title" --format clean [--site site1]
     """
     try:
-        client = PlatformRegistry.get_platform("confluence", site_alias=site)
-        client.connect()
-
         if format not in ["clean", "storage", "raw"]:
             raise click.BadParameter('Format must be one of: "clean", "storage", "raw"')
 
-        page = client.get_page_by_title(space_key, title)
+        page = invoke("confluence", site, "get_page_by_title", space_key, title)
 
         if not page:
             click.echo(f"No page found with title '{title}' in space {space_key}")
             return
 
         if format == "raw":
-            click.echo(page)
+            emit(page)
             return
 
         if format == "clean":
-            content = client.content_cleaner.clean(page["body"]["storage"]["value"])
+            # Imported here so that loading the CLI doesn't pull in the platform
+            # backends (atlassian-python-api, requests, bs4)
+            from conduit.platforms.confluence.content import ConfluenceContentCleaner
+
+            content = ConfluenceContentCleaner().clean(page["body"]["storage"]["value"])
         else:  # storage format
             content = page["body"]["storage"]["value"]
 
@@ -175,6 +283,6 @@ def get(space_key: str, title: str, format: str, site: str):
         click.echo("\nContent:")
         click.echo(content)
 
-    except Exception as e:
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
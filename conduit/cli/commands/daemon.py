@@ -0,0 +1,79 @@
+import sys
+
+import click
+
+from conduit.cli import daemon as conduit_daemon
+from conduit.cli.commands import COMMAND_ERRORS
+
+
+@click.group()
+def daemon():
+    """Background daemon commands.
+
+    The daemon keeps authenticated Jira and Confluence clients warm so that
+    repeated CLI invocations skip configuration loading and reconnecting:
+      • Start or stop the daemon
+      • Check whether it is running
+
+    While the daemon is running, platform commands are forwarded to it
+    automatically. Set CONDUIT_DAEMON=1 to start it on demand, or
+    CONDUIT_NO_DAEMON=1 to always run commands in-process.
+    """
+    pass
+
+
+@daemon.command()
+@click.option("--detach", is_flag=True, help="Run the daemon in the background")
+def start(detach):
+    """Start the Conduit daemon.
+
+    Example: conduit daemon start --detach
+    """
+    if not conduit_daemon.daemon_supported():
+        click.echo("Error: The daemon requires Unix domain socket support", err=True)
+        sys.exit(1)
+
+    socket_path = conduit_daemon.get_socket_path()
+    try:
+        conduit_daemon.ping(socket_path)
+        click.echo(f"Daemon is already running on {socket_path}")
+        return
+    except OSError:
+        pass
+
+    try:
+        if detach:
+            conduit_daemon.spawn(socket_path)
+            click.echo(f"Daemon started on {socket_path}")
+        else:
+            conduit_daemon.serve(socket_path)
+    except COMMAND_ERRORS as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@daemon.command()
+def stop():
+    """Stop the running Conduit daemon.
+
+    Example: conduit daemon stop
+    """
+    try:
+        conduit_daemon.shutdown()
+        click.echo("Daemon stopped")
+    except OSError:
+        click.echo("Daemon is not running")
+
+
+@daemon.command()
+def status():
+    """Show whether the Conduit daemon is running.
+
+    Example: conduit daemon status
+    """
+    socket_path = conduit_daemon.get_socket_path()
+    try:
+        clients = conduit_daemon.ping(socket_path)
+        click.echo(f"Daemon is running on {socket_path} ({clients} cached clients)")
+    except OSError:
+        click.echo("Daemon is not running")
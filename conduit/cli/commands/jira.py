@@ -1,11 +1,21 @@
+import sys
+
 import click
-from conduit.platforms.registry import PlatformRegistry
-from conduit.core.exceptions import PlatformError
+from conduit.cli.commands import COMMAND_ERRORS
+from conduit.cli.daemon import invoke, invoke_many
+from conduit.cli.output import emit, emit_records, output_option
 from pathlib import Path
 from conduit.core.content import ContentManager
 from conduit.core.config import load_config
 
 
+def _issue_columns(issue):
+    """Columns for an issue in tsv output: key, summary and status."""
+    fields = issue.get("fields") or {}
+    status = fields.get("status") or {}
+    return issue.get("key"), fields.get("summary"), status.get("name")
+
+
 @click.group()
 def jira():
     """Jira issue tracking commands.
@@ -43,32 +53,82 @@ def get(key, site):
     Example: conduit jira issue get PROJ-123 [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-        result = platform.get(key)
-        click.echo(result)
-    except Exception as e:
+        result = invoke("jira", site, "get", key)
+        emit(result)
+    except COMMAND_ERRORS as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@issue.command()
+@click.argument("keys", nargs=-1, required=True)
+@click.option("--site", help="Site alias to use for this operation")
+def batch_get(keys, site):
+    """Get complete details of several Jira issues at once.
+
+    Issues are fetched concurrently over a single connection and printed
+    in the order given.
+    Example: conduit jira issue batch-get PROJ-123 PROJ-124 PROJ-125 [--site site1]
+    """
+    try:
+        results = invoke_many("jira", site, "get", [(key,) for key in keys])
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
+
+    failed = False
+    for key, result in zip(keys, results):
+        if isinstance(result, Exception):
+            click.echo(f"Error getting {key}: {str(result)}", err=True)
+            failed = True
+        else:
+            emit(result)
+    if failed:
+        sys.exit(1)
 
 
 @issue.command()
 @click.argument("query")
+@click.option(
+    "--fields",
+    default="key,summary,status",
+    help="Comma-separated fields to return, or *all for every field",
+)
+@click.option("--max-results", default=50, help="Maximum number of issues to return")
+@click.option(
+    "--all",
+    "fetch_all",
+    is_flag=True,
+    help="Return every matching issue, ignoring --max-results",
+)
+@click.option("--start-at", default=0, help="Index of the first issue to return")
+@output_option
 @click.option("--site", help="Site alias to use for this operation")
-def search(query, site):
+def search(query, fields, max_results, fetch_all, start_at, output_format, site):
     """Search Jira issues using JQL syntax.
 
     Supports full JQL (Jira Query Language) for advanced filtering.
+    Only key, summary and status are returned unless --fields is given, and
+    at most 50 issues unless --max-results or --all is given.
     Example: conduit jira issue search "project = PROJ AND status = 'In Progress'" [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-        results = platform.search(query)
-        click.echo(results)
-    except Exception as e:
+        results = invoke(
+            "jira",
+            site,
+            "search",
+            query,
+            fields=fields.split(","),
+            start=start_at,
+            limit=None if fetch_all else max_results,
+        )
+        if output_format == "human":
+            emit(results)
+        else:
+            emit_records(results, output_format, _issue_columns)
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @issue.command()
@@ -98,11 +158,11 @@ def create(project, summary, content_file, type, site):
     content_manager = ContentManager(config.get_content_dir())
 
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-
         description = content_manager.read_content(content_file_path)
-        result = platform.create(
+        result = invoke(
+            "jira",
+            site,
+            "create",
             project={"key": project},
             summary=summary,
             description=description,
@@ -110,27 +170,23 @@ def create(project, summary, content_file, type, site):
         )
 
         # Only cleanup the file if it's in our content directory
-        if str(content_file_path.absolute()).startswith(
-            str(config.get_content_dir().absolute())
-        ):
+        if content_manager.is_content_file(content_file_path):
             content_manager.cleanup_content_file(content_file_path)
 
-        click.echo(result)
-    except Exception as e:
+        emit(result)
+    except COMMAND_ERRORS as e:
         # Only move to failed if it's in our content directory
-        if str(content_file_path.absolute()).startswith(
-            str(config.get_content_dir().absolute())
-        ):
+        if content_manager.is_content_file(content_file_path):
             try:
                 failed_path = content_manager.mark_content_as_failed(content_file_path)
                 click.echo(f"Content file moved to: {failed_path}")
-            except Exception as move_error:
+            except (ValueError, OSError) as move_error:
                 click.echo(
                     f"Warning: Failed to move content file: {move_error}", err=True
                 )
 
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @issue.command()
@@ -163,8 +219,6 @@ def update(key, summary, description, content_file, site):
     content_manager = ContentManager(config.get_content_dir())
 
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
         fields = {}
 
         if summary:
@@ -175,30 +229,26 @@ def update(key, summary, description, content_file, site):
         elif description:
             fields["description"] = description
 
-        platform.update(key, **fields)
+        invoke("jira", site, "update", key, **fields)
 
         # Only cleanup the file if it's in our content directory
-        if content_file_path and str(content_file_path.absolute()).startswith(
-            str(config.get_content_dir().absolute())
-        ):
+        if content_file_path and content_manager.is_content_file(content_file_path):
             content_manager.cleanup_content_file(content_file_path)
 
         click.echo(f"Successfully updated issue {key}")
-    except Exception as e:
+    except COMMAND_ERRORS as e:
         # Only move to failed if it's in our content directory
-        if content_file_path and str(content_file_path.absolute()).startswith(
-            str(config.get_content_dir().absolute())
-        ):
+        if content_file_path and content_manager.is_content_file(content_file_path):
             try:
                 failed_path = content_manager.mark_content_as_failed(content_file_path)
                 click.echo(f"Content file moved to: {failed_path}")
-            except Exception as move_error:
+            except (ValueError, OSError) as move_error:
                 click.echo(
                     f"Warning: Failed to move content file: {move_error}", err=True
                 )
 
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @issue.command()
@@ -226,35 +276,28 @@ def comment(key, content_file, site):
     content_manager = ContentManager(config.get_content_dir())
 
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-
         comment_text = content_manager.read_content(content_file_path)
-        result = platform.add_comment(key, comment_text)
+        result = invoke("jira", site, "add_comment", key, comment_text)
 
         # Only cleanup the file if it's in our content directory
-        if str(content_file_path.absolute()).startswith(
-            str(config.get_content_dir().absolute())
-        ):
+        if content_manager.is_content_file(content_file_path):
             content_manager.cleanup_content_file(content_file_path)
 
         click.echo(f"Successfully added comment to issue {key}")
-        click.echo(result)
-    except Exception as e:
+        emit(result)
+    except COMMAND_ERRORS as e:
         # Only move to failed if it's in our content directory
-        if str(content_file_path.absolute()).startswith(
-            str(config.get_content_dir().absolute())
-        ):
+        if content_manager.is_content_file(content_file_path):
             try:
                 failed_path = content_manager.mark_content_as_failed(content_file_path)
                 click.echo(f"Content file moved to: {failed_path}")
-            except Exception as move_error:
+            except (ValueError, OSError) as move_error:
                 click.echo(
                     f"Warning: Failed to move content file: {move_error}", err=True
                 )
 
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @issue.command()
@@ -268,13 +311,11 @@ def status(key, status, site):
     Example: conduit jira issue status PROJ-123 "In Progress" [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-        platform.transition_status(key, status)
+        invoke("jira", site, "transition_status", key, status)
         click.echo(f"Successfully transitioned issue {key} to '{status}'")
-    except Exception as e:
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @issue.command()
@@ -287,23 +328,23 @@ def remote_links(key, site):
     Example: conduit jira issue remote-links PROJ-123 [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-        links = platform.get_remote_links(key)
+        links = invoke("jira", site, "get_remote_links", key)
         if not links:
             click.echo("No remote links found for this issue.")
             return
+        blocks = []
         for link in links:
-            relationship = link.get("relationship", "relates to")
-            object_data = link.get("object", {})
-            title = object_data.get("title", "No title")
-            url = object_data.get("url", "No URL")
-            click.echo(f"\n{title}")
-            click.echo(f"Relationship: {relationship}")
-            click.echo(f"URL: {url}")
-    except Exception as e:
+            # The API can return "object": null, so don't rely on .get's default
+            obj = link.get("object") or {}
+            blocks.append(
+                f"\n{obj.get('title', 'No title')}\n"
+                f"Relationship: {link.get('relationship', 'relates to')}\n"
+                f"URL: {obj.get('url', 'No URL')}"
+            )
+        click.echo("\n".join(blocks))
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @jira.command()
@@ -316,9 +357,7 @@ def get_boards(project, site):
     Example: conduit jira get-boards --project PROJ [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-        boards = platform.get_boards(project)
+        boards = invoke("jira", site, "get_boards", project)
         if not boards:
             click.echo(f"No boards found for project {project}")
             return
@@ -331,9 +370,9 @@ def get_boards(project, site):
             click.echo(
                 f"  Location: {board.get('location', {}).get('projectName', 'Unknown Project')}\n"
             )
-    except Exception as e:
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @jira.command()
@@ -351,9 +390,7 @@ def get_sprints(board_id, state, site):
     Example: conduit jira get-sprints BOARD-123 --state active [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-        sprints = platform.get_sprints(board_id, state)
+        sprints = invoke("jira", site, "get_sprints", board_id, state)
         if not sprints:
             click.echo(f"No sprints found for board {board_id}")
             return
@@ -365,9 +402,9 @@ def get_sprints(board_id, state, site):
             click.echo(f"  State: {sprint.get('state', 'Unknown')}")
             click.echo(f"  Start Date: {sprint.get('startDate', 'Not set')}")
             click.echo(f"  End Date: {sprint.get('endDate', 'Not set')}\n")
-    except Exception as e:
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
 
 
 @jira.command()
@@ -383,12 +420,10 @@ def add_to_sprint(sprint_id, issues, site):
     Example: conduit jira add-to-sprint SPRINT-456 --issues PROJ-123 PROJ-124 [--site site1]
     """
     try:
-        platform = PlatformRegistry.get_platform("jira", site_alias=site)
-        platform.connect()
-        platform.add_issues_to_sprint(sprint_id, list(issues))
+        invoke("jira", site, "add_issues_to_sprint", sprint_id, list(issues))
         click.echo(
             f"Successfully added issues {', '.join(issues)} to sprint {sprint_id}"
         )
-    except Exception as e:
+    except COMMAND_ERRORS as e:
         click.echo(f"Error: {str(e)}", err=True)
-        exit(1)
+        sys.exit(1)
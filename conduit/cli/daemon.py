@@ -0,0 +1,438 @@
+"""Background daemon that keeps authenticated platform clients warm for the CLI.
+
+The CLI normally pays interpreter start-up, configuration loading and a fresh
+connection for every command. When the daemon is running, commands forward
+their platform calls over a Unix domain socket to a single long-lived process
+that owns the connected clients.
+"""
+
+import functools
+import getpass
+import json
+import os
+import socket
+import socketserver
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from conduit.core.exceptions import PlatformError
+from conduit.core.logger import logger
+
+# Methods that must never be triggered remotely
+_BLOCKED_METHODS = {"connect", "disconnect"}
+
+# Seconds to wait before checking whether a refusing daemon socket is stale
+STALE_SOCKET_RETRY_DELAY = 0.2
+
+
+def get_socket_path() -> Path:
+    """Get the path of the daemon's Unix domain socket.
+
+    The socket lives in a per-user directory so that other users cannot
+    pre-create or replace it.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "conduit" / "conduit.sock"
+    return Path(tempfile.gettempdir()) / f"conduit-{getpass.getuser()}" / "conduit.sock"
+
+
+def daemon_supported() -> bool:
+    """Check whether the platform supports Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+def _ensure_private_dir(path: Path) -> None:
+    """Create the socket directory, readable only by the current user.
+
+    Raises:
+        PlatformError: If the directory exists but is not a private
+            directory owned by the current user
+    """
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    st = path.lstat()
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PlatformError(f"Refusing to use insecure daemon directory: {path}")
+
+
+def _check_socket(socket_path: Path) -> None:
+    """Make sure a socket belongs to the current user before connecting to it.
+
+    Raises:
+        FileNotFoundError: If there is no socket at the path
+        PlatformError: If the path is not a socket owned by the current user
+    """
+    st = socket_path.lstat()
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        raise PlatformError(f"Refusing to use untrusted daemon socket: {socket_path}")
+
+
+def _config_version() -> Optional[Tuple[int, int]]:
+    """Get the config file's modification time and size, if it exists."""
+    from conduit.core.config import get_config_dir
+
+    try:
+        st = (get_config_dir() / "config.yaml").stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _connected_for_config(
+    platform_name: str,
+    site_alias: Optional[str],
+    config_version: Optional[Tuple[int, int]],
+):
+    """Create and connect a platform client for one version of the config."""
+    from conduit.platforms.registry import PlatformRegistry
+
+    client = PlatformRegistry.get_platform(platform_name, site_alias=site_alias)
+    client.connect()
+    return client
+
+
+def _connected(platform_name: str, site_alias: Optional[str]):
+    """Get a connected platform client, creating it on first use.
+
+    Clients are cached per (platform, site alias) and reused until the config
+    file changes, so several calls in one invocation, or in the daemon, share
+    a connection while edited credentials are still picked up.
+    """
+    return _connected_for_config(platform_name, site_alias, _config_version())
+
+
+def _call(client, method: str, args: list, kwargs: dict) -> Any:
+    """Call a public method on a connected platform client."""
+    if method.startswith("_") or method in _BLOCKED_METHODS:
+        raise PlatformError(f"Method '{method}' cannot be invoked")
+    func = getattr(client, method, None)
+    if not callable(func):
+        raise PlatformError(f"Unknown method '{method}'")
+    return func(*args, **kwargs)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single JSON-encoded platform call."""
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get("command") == "shutdown":
+                threading.Thread(target=self.server.shutdown).start()
+                result = None
+            elif request.get("command") == "ping":
+                result = _connected_for_config.cache_info().currsize
+            else:
+                result = self._dispatch(request)
+
+            if isinstance(result, types.GeneratorType):
+                self._write({"ok": True, "stream": True})
+                for item in result:
+                    self._write({"item": item})
+                self._write({"end": True})
+            else:
+                self._write({"ok": True, "result": result})
+        except (BrokenPipeError, ConnectionResetError) as e:
+            # The client went away, so there is nobody to report the error to
+            logger.debug(f"Daemon client disconnected: {e}")
+        except Exception as e:
+            logger.error(f"Daemon request failed: {e}")
+            try:
+                self._write({"ok": False, "error": str(e)})
+            except OSError as write_error:
+                logger.debug(f"Could not report error to client: {write_error}")
+
+    def _write(self, message: Any) -> None:
+        self.wfile.write(json.dumps(message, default=str).encode() + b"\n")
+
+    def _dispatch(self, request: Dict[str, Any]) -> Any:
+        client = self.server.get_client(request["platform"], request.get("site_alias"))
+        return _call(
+            client,
+            request["method"],
+            request.get("args", []),
+            request.get("kwargs", {}),
+        )
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server sharing connected clients across requests."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path):
+        self.socket_path = socket_path
+        self._lock = threading.Lock()
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def server_bind(self) -> None:
+        # Create the socket with owner-only permissions instead of fixing
+        # them after bind, which would leave a window for other users
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+    def get_client(self, platform_name: str, site_alias: Optional[str]):
+        """Get the cached client for a platform and site, connecting on first use."""
+        # Serialize lookups so concurrent first requests connect only once
+        with self._lock:
+            return _connected(platform_name, site_alias)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def serve(socket_path: Optional[Path] = None) -> None:
+    """Run the daemon in the foreground until interrupted."""
+    socket_path = socket_path or get_socket_path()
+    _ensure_private_dir(socket_path.parent)
+    socket_path.unlink(missing_ok=True)
+    server = DaemonServer(socket_path)
+    logger.info(f"Conduit daemon listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Conduit daemon stopped")
+    finally:
+        server.server_close()
+
+
+def _responds(socket_path: Path) -> bool:
+    """Check whether a daemon is accepting requests on a socket."""
+    try:
+        ping(socket_path)
+        return True
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+
+
+def spawn(socket_path: Optional[Path] = None, timeout: float = 5.0) -> None:
+    """Start the daemon in a detached process and wait until it answers a ping.
+
+    Raises:
+        PlatformError: If the daemon does not come up within the timeout
+    """
+    socket_path = socket_path or get_socket_path()
+    subprocess.Popen(
+        [sys.executable, "-m", "conduit.cli.daemon", str(socket_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        # The socket file appears at bind, before the server listens, so only
+        # a successful ping shows the daemon is ready
+        if _responds(socket_path):
+            return
+        time.sleep(0.05)
+    raise PlatformError(f"Conduit daemon did not start within {timeout} seconds")
+
+
+def _send(payload: Dict[str, Any], socket_path: Path) -> Any:
+    """Send one request to the daemon and return the decoded result.
+
+    Streamed results are returned as an iterator that reads items from the
+    socket as the daemon produces them.
+    """
+    _check_socket(socket_path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        f = sock.makefile("rb")
+        response = json.loads(f.readline())
+        if not response["ok"]:
+            raise PlatformError(response["error"])
+        if response.get("stream"):
+            return _read_stream(sock, f)
+    except BaseException:
+        sock.close()
+        raise
+    sock.close()
+    return response["result"]
+
+
+def _read_stream(sock: socket.socket, f) -> Iterator[Any]:
+    """Yield streamed items until the daemon signals the end of the stream."""
+    try:
+        for line in f:
+            message = json.loads(line)
+            if "item" in message:
+                yield message["item"]
+            elif message.get("end"):
+                return
+            else:
+                raise PlatformError(message["error"])
+        raise PlatformError("Daemon closed the connection mid-stream")
+    finally:
+        f.close()
+        sock.close()
+
+
+def ping(socket_path: Optional[Path] = None) -> int:
+    """Check that the daemon is alive, returning its number of cached clients."""
+    return _send({"command": "ping"}, socket_path or get_socket_path())
+
+
+def shutdown(socket_path: Optional[Path] = None) -> None:
+    """Ask a running daemon to stop."""
+    _send({"command": "shutdown"}, socket_path or get_socket_path())
+
+
+def request(
+    platform_name: str,
+    site_alias: Optional[str],
+    method: str,
+    *args,
+    socket_path: Optional[Path] = None,
+    **kwargs,
+) -> Any:
+    """Send a platform call to the daemon and return its result.
+
+    Raises:
+        PlatformError: If the daemon reports an error
+        OSError: If the daemon cannot be reached
+    """
+    socket_path = socket_path or get_socket_path()
+    payload = {
+        "platform": platform_name,
+        "site_alias": site_alias,
+        "method": method,
+        "args": list(args),
+        "kwargs": kwargs,
+    }
+    return _send(payload, socket_path)
+
+
+def _use_daemon(socket_path: Path) -> bool:
+    """Decide whether a call should be forwarded to the daemon.
+
+    The daemon is used when it is already running. Setting CONDUIT_DAEMON=1
+    starts it on demand, and CONDUIT_NO_DAEMON=1 always runs in-process.
+    A socket that is not owned by the current user is never used.
+    """
+    if os.environ.get("CONDUIT_NO_DAEMON") == "1" or not daemon_supported():
+        return False
+    try:
+        _check_socket(socket_path)
+        return True
+    except FileNotFoundError:
+        pass
+    except PlatformError as e:
+        logger.warning(str(e))
+        return False
+    if os.environ.get("CONDUIT_DAEMON") == "1":
+        spawn(socket_path)
+        return True
+    return False
+
+
+def invoke(platform_name: str, site_alias: Optional[str], method: str, *args, **kwargs):
+    """Call a platform client method, through the daemon when it is available.
+
+    Args:
+        platform_name: Registered platform name ("jira" or "confluence")
+        site_alias: Site alias to use, or None for the default site
+        method: Name of the client method to call
+
+    Returns:
+        The method's result
+    """
+    socket_path = get_socket_path()
+    if _use_daemon(socket_path):
+        try:
+            return request(
+                platform_name,
+                site_alias,
+                method,
+                *args,
+                socket_path=socket_path,
+                **kwargs,
+            )
+        except (ConnectionRefusedError, FileNotFoundError):
+            # A live daemon can briefly refuse connections, so the socket is
+            # only removed if it still does not answer after a short wait
+            logger.debug(f"Daemon unavailable, running in-process: {socket_path}")
+            time.sleep(STALE_SOCKET_RETRY_DELAY)
+            if not _responds(socket_path):
+                logger.debug(f"Removing stale daemon socket: {socket_path}")
+                socket_path.unlink(missing_ok=True)
+
+    client = _connected(platform_name, site_alias)
+    return _call(client, method, list(args), kwargs)
+
+
+def _gather(
+    call: Callable[[tuple], Any], calls: List[tuple], max_concurrency: int
+) -> List[Any]:
+    """Run blocking calls in threads, at most max_concurrency at a time."""
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = [executor.submit(call, args) for args in calls]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def invoke_many(
+    platform_name: str,
+    site_alias: Optional[str],
+    method: str,
+    calls: List[tuple],
+    max_concurrency: int = 8,
+) -> List[Any]:
+    """Call a platform client method once per argument tuple, concurrently.
+
+    In-process calls share the cached connected client. The concurrency limit
+    keeps bulk operations under the platform's API rate limits.
+
+    Args:
+        platform_name: Registered platform name ("jira" or "confluence")
+        site_alias: Site alias to use, or None for the default site
+        method: Name of the client method to call
+        calls: Positional arguments for each call
+        max_concurrency: Maximum number of calls in flight (default: 8)
+
+    Returns:
+        Results in the order of calls. A call that failed has its exception
+        in place of a result.
+    """
+    socket_path = get_socket_path()
+    if _use_daemon(socket_path):
+
+        def call(args: tuple) -> Any:
+            return request(
+                platform_name, site_alias, method, *args, socket_path=socket_path
+            )
+
+    else:
+        client = _connected(platform_name, site_alias)
+
+        def call(args: tuple) -> Any:
+            return _call(client, method, list(args), {})
+
+    return _gather(call, calls, max_concurrency)
+
+
+if __name__ == "__main__":
+    serve(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
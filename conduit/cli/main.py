@@ -1,23 +1,17 @@
 import click
 import functools
+import importlib
 import logging
 import sys
-import asyncio
-from pathlib import Path
-from typing import Optional
-
-from conduit.platforms.registry import PlatformRegistry
-from conduit.core.exceptions import PlatformError, ConfigurationError
-from conduit.cli.commands.jira import jira
-from conduit.cli.commands.confluence import confluence
-from conduit.core.config import (
-    create_default_config,
-    get_config_dir,
-    load_config,
-    SiteConfig,
-)
+
+from conduit.core.exceptions import ConfigurationError
 from conduit.core.logger import logger
-from conduit.core.content import ContentManager
+
+# Configuration, content and platform modules pull in pydantic, YAML and the
+# Atlassian clients, so commands import them when they run rather than here.
+
+_ROOT_LOGGER = logging.getLogger()
+_CONDUIT_LOGGER = logging.getLogger("conduit")
 
 
 def handle_error(func):
@@ -36,6 +30,8 @@ def handle_error(func):
 
 def init_config():
     """Initialize the configuration file."""
+    from conduit.core.config import create_default_config, get_config_dir
+
     config_path = get_config_dir() / "config.yaml"
     if config_path.exists():
         logger.error(f"Configuration file already exists at {config_path}")
@@ -56,13 +52,34 @@ def init_config():
 
 
 class ConduitCLI(click.Group):
-    """Custom Click Group that handles global flags without requiring commands."""
+    """Custom Click Group that handles global flags without requiring commands.
+
+    Platform command groups are listed in lazy_subcommands and only imported
+    when invoked, so running one command does not build every other command tree.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Map of command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_lazy(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_lazy(self, cmd_name):
+        module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+        return getattr(importlib.import_module(module_name), attr)
 
     def invoke(self, ctx):
         """Handle global flags before command processing."""
         if ctx.params.get("verbose"):
-            logging.getLogger().setLevel(logging.INFO)
-            logging.getLogger("conduit").setLevel(logging.DEBUG)
+            _ROOT_LOGGER.setLevel(logging.INFO)
+            _CONDUIT_LOGGER.setLevel(logging.DEBUG)
             logger.debug("Verbose logging enabled")
 
         if ctx.params.get("init"):
@@ -72,7 +89,14 @@ class ConduitCLI(click.Group):
         return super().invoke(ctx)
 
 
-@click.group(cls=ConduitCLI)
+@click.group(
+    cls=ConduitCLI,
+    lazy_subcommands={
+        "jira": "conduit.cli.commands.jira:jira",
+        "confluence": "conduit.cli.commands.confluence:confluence",
+        "daemon": "conduit.cli.commands.daemon:daemon",
+    },
+)
 @click.option(
     "--verbose", is_flag=True, help="Enable verbose output for troubleshooting"
 )
@@ -123,11 +147,13 @@ def config():
 @handle_error
 def clean():
     """Delete existing configuration file."""
+    from conduit.core.config import get_config_dir
+
     config_path = get_config_dir() / "config.yaml"
-    if config_path.exists():
+    try:
         config_path.unlink()
         logger.info(f"Deleted configuration file: {config_path}")
-    else:
+    except FileNotFoundError:
         logger.info("No configuration file found")
 
 
@@ -149,6 +175,8 @@ def list(platform):
       $ conduit config list --platform jira
       $ conduit config list --platform confluence
     """
+    from conduit.core.config import load_config
+
     try:
         config = load_config()
 
@@ -197,6 +225,8 @@ def connect(platform_name, site):
       $ conduit connect jira
       $ conduit connect confluence --site site1
     """
+    from conduit.platforms.registry import PlatformRegistry
+
     platform = PlatformRegistry.get_platform(platform_name, site_alias=site)
     platform.connect()
     logger.info(
@@ -205,11 +235,6 @@ def connect(platform_name, site):
     )
 
 
-# Register platform-specific command groups
-cli.add_command(jira)
-cli.add_command(confluence)
-
-
 @cli.command()
 def get_content_path() -> None:
     """Get a path for storing formatted content.
@@ -224,6 +249,9 @@ def get_content_path() -> None:
         $ path=$(conduit get-content-path)
         $ echo "# My Content" > "$path"
     """
+    from conduit.core.config import load_config
+    from conduit.core.content import ContentManager
+
     try:
         config = load_config()
         content_manager = ContentManager(config.get_content_dir())
@@ -0,0 +1,77 @@
+"""Output helpers shared by the CLI commands."""
+
+from typing import Any, Callable, Iterable, Sequence
+
+import click
+
+from conduit.core.serialization import to_json, to_json_line
+
+
+def to_tsv_row(values: Sequence[Any]) -> str:
+    """Join values into a tab-separated row, flattening embedded tabs and newlines."""
+    return "\t".join(
+        "" if value is None else " ".join(str(value).split()) for value in values
+    )
+
+
+OUTPUT_FORMATS = ["human", "json", "ndjson", "tsv"]
+
+output_option = click.option(
+    "--output",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="human",
+    help="Output format: human, json, ndjson (one record per line), or tsv",
+)
+
+
+def emit_records(
+    records: Iterable[Any],
+    output_format: str,
+    tsv_columns: Callable[[Any], Sequence[Any]],
+    batch_size: int = 100,
+) -> int:
+    """Print records in a machine-readable format.
+
+    ndjson and tsv rows are written in batches as records arrive, so long
+    listings start printing before the last record has been fetched.
+
+    Args:
+        records: Records to print
+        output_format: One of "json", "ndjson" or "tsv"
+        tsv_columns: Picks the column values for a record in tsv output
+        batch_size: Number of rows to write per batch (default: 100)
+
+    Returns:
+        Number of records printed
+    """
+    if output_format == "json":
+        records = [*records]
+        click.echo(to_json(records))
+        return len(records)
+
+    format_row = (
+        to_json_line
+        if output_format == "ndjson"
+        else (lambda record: to_tsv_row(tsv_columns(record)))
+    )
+    count = 0
+    rows = []
+    for record in records:
+        rows.append(format_row(record))
+        if len(rows) >= batch_size:
+            click.echo("\n".join(rows))
+            count += len(rows)
+            rows.clear()
+    if rows:
+        click.echo("\n".join(rows))
+        count += len(rows)
+    return count
+
+
+def emit(obj: Any) -> None:
+    """Print an API response, as JSON for dicts and lists."""
+    if isinstance(obj, (dict, list)):
+        click.echo(to_json(obj))
+    else:
+        click.echo(obj)
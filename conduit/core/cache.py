@@ -0,0 +1,143 @@
+"""Caches for API responses."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from conduit.core.logger import logger
+
+
+def get_cache_dir() -> Path:
+    """Get the cache directory path based on the OS."""
+    if os.name == "nt":  # Windows
+        return Path(os.environ.get("LOCALAPPDATA")) / "conduit" / "cache"
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "conduit"
+
+
+class ResponseCache:
+    """Cache of API responses stored as JSON files.
+
+    Each entry is stored with a validator, such as a fingerprint of the remote
+    data taken when the entry was written. An entry is only returned when the
+    caller presents the same validator, so stale responses are never served.
+
+    At most max_entries files are kept; writing a new entry removes the least
+    recently written ones beyond that.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 64):
+        self.cache_dir = cache_dir or get_cache_dir()
+        self.max_entries = max_entries
+
+    def _path(self, key: tuple) -> Path:
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, key: tuple, validator: Any) -> Optional[Any]:
+        """Get a cached value if it was stored with the same validator.
+
+        Args:
+            key: Tuple of JSON-serializable values identifying the request
+            validator: Current fingerprint of the remote data
+
+        Returns:
+            The cached value, or None on a miss or a stale entry
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("validator") != validator:
+            logger.debug(f"Cache entry for {key} is stale")
+            return None
+        return entry.get("value")
+
+    def set(self, key: tuple, validator: Any, value: Any) -> None:
+        """Store a value, replacing any previous entry for the key.
+
+        Failures to write are logged and otherwise ignored.
+        """
+        path = self._path(key)
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"validator": validator, "value": value}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        """Remove the oldest entries once the cache holds more than max_entries."""
+        try:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".json"):
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+        except OSError as e:
+            logger.warning(f"Failed to list cache directory {self.cache_dir}: {e}")
+            return
+        entries.sort()
+        for _, path in entries[: max(0, len(entries) - self.max_entries)]:
+            logger.debug(f"Evicting cache entry {path}")
+            Path(path).unlink(missing_ok=True)
+
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after a fixed time.
+
+    The least recently used entry is evicted once the cache holds maxsize
+    entries.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Get a value that has not yet expired, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value for ttl seconds, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Any) -> None:
+        """Remove the entry for a key, if there is one."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
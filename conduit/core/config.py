@@ -1,18 +1,37 @@
 from pathlib import Path
 import yaml
-import shutil
 import os
-import importlib.resources as pkg_resources
-from pydantic import BaseModel
-from typing import Dict, Optional
+from importlib.resources import files
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Optional, Tuple
 
 from conduit.core.exceptions import ConfigurationError
 from conduit.core.logger import logger
 
+# Use libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def _to_kebab(field_name: str) -> str:
+    """Map a field name to its YAML key, e.g. default_site_alias -> default-site-alias."""
+    return field_name.replace("_", "-")
+
+
+# Platform sections accept both the YAML keys and the Python field names
+_PLATFORM_MODEL_CONFIG = ConfigDict(
+    alias_generator=_to_kebab, populate_by_name=True, frozen=True
+)
+
 
 class SiteConfig(BaseModel):
     """Configuration for a single Atlassian site."""
 
+    model_config = ConfigDict(frozen=True)
+
     url: str
     email: str
     api_token: str
@@ -21,13 +40,11 @@ class SiteConfig(BaseModel):
 class JiraConfig(BaseModel):
     """Jira configuration."""
 
+    model_config = _PLATFORM_MODEL_CONFIG
+
     default_site_alias: str = "default"  # Field alias for YAML compatibility
     sites: Dict[str, SiteConfig]
 
-    class Config:
-        alias_generator = lambda string: string.replace("_", "-")
-        populate_by_alias = True
-
     def get_site_config(self, site_alias: Optional[str] = None) -> SiteConfig:
         """Get the configuration for a specific site or the default site."""
         alias = site_alias or self.default_site_alias
@@ -39,13 +56,11 @@ class JiraConfig(BaseModel):
 class ConfluenceConfig(BaseModel):
     """Confluence configuration."""
 
+    model_config = _PLATFORM_MODEL_CONFIG
+
     default_site_alias: str = "default"  # Field alias for YAML compatibility
     sites: Dict[str, SiteConfig]
 
-    class Config:
-        alias_generator = lambda string: string.replace("_", "-")
-        populate_by_alias = True
-
     def get_site_config(self, site_alias: Optional[str] = None) -> SiteConfig:
         """Get the configuration for a specific site or the default site."""
         alias = site_alias or self.default_site_alias
@@ -72,8 +87,13 @@ class Config(BaseModel):
         return self.content_dir
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get the configuration directory path based on the OS."""
+    """Get the configuration directory path based on the OS.
+
+    The result is computed once per process; the environment it depends on
+    does not change while Conduit is running.
+    """
     if os.name == "nt":  # Windows
         config_dir = Path(os.environ.get("APPDATA")) / "conduit"
     else:  # Unix-like systems
@@ -90,28 +110,54 @@ def create_default_config(config_path: Path) -> None:
 
     # Copy default config from package
     try:
-        with pkg_resources.path("conduit.config", "config.yaml") as default_config:
-            shutil.copy(default_config, config_path)
+        default_config = files("conduit.config").joinpath("config.yaml")
+        config_path.write_bytes(default_config.read_bytes())
         logger.info(f"Created default configuration file at {config_path}")
     except Exception as e:
         raise ConfigurationError(f"Failed to create default config: {e}")
 
 
+# Last loaded config, keyed on the file's path, modification time and size
+_config_cache: Optional[Tuple[Tuple[Path, int, int], Config]] = None
+
+
 def load_config() -> Config:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file.
+
+    The parsed config is reused until the file's modification time or size
+    changes, so repeated calls in one process (such as the MCP server's tool
+    calls) don't re-read and re-validate it. Callers share the returned
+    object and should not modify it.
+    """
+    global _config_cache
     config_path = get_config_dir() / "config.yaml"
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         raise ConfigurationError(
             f"Configuration file not found at {config_path}. "
             "Run 'conduit --init' to create a default configuration file."
         )
 
+    key = (config_path, stat.st_mtime_ns, stat.st_size)
+    if _config_cache is not None and _config_cache[0] == key:
+        return _config_cache[1]
+
     try:
         with open(config_path) as f:
-            data = yaml.safe_load(f)
-        return Config(**data)
+            data = yaml.load(f, Loader=SafeLoader)
+        config = Config(**data)
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Invalid YAML in config file: {e}")
     except Exception as e:
         raise ConfigurationError(f"Error loading config: {e}")
+
+    _config_cache = (key, config)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Forget the cached config so the next load_config() re-reads the file."""
+    global _config_cache
+    _config_cache = None
@@ -1,5 +1,7 @@
 """Content management module for handling formatted text content."""
 
+import errno
+import os
 from pathlib import Path
 import uuid
 import shutil
@@ -16,21 +18,44 @@ class ContentManager:
             content_dir: Path to the directory where content files will be stored
         """
         self.content_dir = content_dir
-        self.content_dir.mkdir(parents=True, exist_ok=True)
         self.failed_content_dir = content_dir / "failed_content"
+        # Creating the nested directory creates the content directory with it
         self.failed_content_dir.mkdir(parents=True, exist_ok=True)
+        # Resolved once for generated paths and the containment checks. The
+        # trailing separator keeps sibling directories such as "content2" out.
+        self._absolute_content_dir = content_dir.absolute()
+        self._content_dir_prefix = os.path.join(os.path.abspath(content_dir), "")
         logger.debug(f"Initialized ContentManager with directory: {content_dir}")
 
+    def is_content_file(self, file_path: Path) -> bool:
+        """Check whether a path lies within the content directory.
+
+        Args:
+            file_path: Path to check
+
+        Returns:
+            bool: True if the path is inside the content directory
+        """
+        return os.path.abspath(file_path).startswith(self._content_dir_prefix)
+
+    def _check_within_content_dir(self, file_path: Path) -> None:
+        """Raise ValueError if a path is outside the content directory."""
+        if not self.is_content_file(file_path):
+            raise ValueError(
+                f"File path must be within content directory: {self.content_dir}"
+            )
+
     def generate_content_path(self) -> Path:
         """Generate a new path for content storage.
 
         Returns:
             Path: The absolute path where content can be stored
         """
+        # A random UUID makes collisions negligible, so no existence check
         file_id = str(uuid.uuid4())
-        content_path = self.content_dir / f"{file_id}.md"
+        content_path = self._absolute_content_dir / f"{file_id}.md"
         logger.debug(f"Generated content path: {content_path}")
-        return content_path.absolute()
+        return content_path
 
     def write_content(self, file_path: Path, content: str) -> None:
         """Write content to a file.
@@ -42,10 +67,7 @@ class ContentManager:
         Raises:
             ValueError: If the file is not within the content directory
         """
-        if not str(file_path.absolute()).startswith(str(self.content_dir.absolute())):
-            raise ValueError(
-                f"File path must be within content directory: {self.content_dir}"
-            )
+        self._check_within_content_dir(file_path)
 
         logger.debug(f"Writing content to file: {file_path}")
         file_path.write_text(content)
@@ -62,11 +84,11 @@ class ContentManager:
         Raises:
             ValueError: If the file does not exist
         """
-        if not file_path.exists():
-            raise ValueError(f"Content file not found: {file_path}")
-
         logger.debug(f"Reading content from file: {file_path}")
-        return file_path.read_text()
+        try:
+            return file_path.read_text()
+        except FileNotFoundError:
+            raise ValueError(f"Content file not found: {file_path}")
 
     def cleanup_content_file(self, file_path: Path) -> None:
         """Delete a content file after successful processing.
@@ -77,10 +99,7 @@ class ContentManager:
         Raises:
             ValueError: If the file is not within the content directory
         """
-        if not str(file_path.absolute()).startswith(str(self.content_dir.absolute())):
-            raise ValueError(
-                f"File path must be within content directory: {self.content_dir}"
-            )
+        self._check_within_content_dir(file_path)
 
         if file_path.exists():
             logger.debug(f"Cleaning up content file: {file_path}")
@@ -98,15 +117,19 @@ class ContentManager:
         Raises:
             ValueError: If the file is not within the content directory
         """
-        if not str(file_path.absolute()).startswith(str(self.content_dir.absolute())):
-            raise ValueError(
-                f"File path must be within content directory: {self.content_dir}"
-            )
-
-        if not file_path.exists():
-            raise ValueError(f"Content file not found: {file_path}")
+        self._check_within_content_dir(file_path)
 
         failed_path = self.failed_content_dir / file_path.name
         logger.debug(f"Moving failed content file to: {failed_path}")
-        shutil.move(str(file_path), str(failed_path))
+        try:
+            # Both directories normally share a filesystem, making this a rename
+            os.replace(file_path, failed_path)
+        except FileNotFoundError:
+            if not file_path.exists():
+                raise ValueError(f"Content file not found: {file_path}")
+            raise
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(file_path), str(failed_path))
         return failed_path
@@ -0,0 +1,27 @@
+"""JSON serialization shared by the CLI and the MCP server."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def to_json(obj: Any) -> str:
+    """Serialize an API response as indented JSON.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    Values JSON cannot represent, such as datetimes, are written as strings.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, default=str, indent=2, ensure_ascii=False)
+
+
+def to_json_line(obj: Any) -> str:
+    """Serialize a record as compact single-line JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False)
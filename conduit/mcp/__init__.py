@@ -1,12 +1,48 @@
 # __init__.py
 """MCP server package"""
+
 import asyncio
+import importlib
 import logging
 import sys
-from .server import server, create_mcp_server
 
 __all__ = ["server", "create_mcp_server"]
 
+logger = logging.getLogger(__name__)
+
+
+def _load_server_module():
+    """Import the server module and bind its exports on this package."""
+    server_module = importlib.import_module(".server", __name__)
+    # Importing the submodule binds its name on this package; rebind the
+    # exports so "server" refers to the FastMCP instance, not the module
+    globals().update({name: getattr(server_module, name) for name in __all__})
+    return server_module
+
+
+def __getattr__(name: str):
+    """Import the server module on first access to its exports.
+
+    Building the server imports FastMCP and registers every tool, which
+    importing this package for main() alone should not pay for up front.
+    """
+    if name in __all__:
+        return getattr(_load_server_module(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _run(coro):
+    """Run a coroutine on uvloop when it is installed, else on asyncio's loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
 
 def main(transport: str = "stdio"):
     """Entry point for MCP server
@@ -14,12 +50,14 @@ def main(transport: str = "stdio"):
     Args:
         transport: Transport mode to use ("sse" or "stdio")
     """
+    server_module = _load_server_module()
+    server_module._configure_logging()
+    server_module._warm_clients()
     try:
-        logger = logging.getLogger(__name__)
         if transport == "stdio":
-            asyncio.run(server.run_stdio_async())
+            _run(server_module.server.run_stdio_async())
         else:
-            asyncio.run(server.run_sse_async())
+            _run(server_module.server.run_sse_async())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
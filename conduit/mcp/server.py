@@ -1,63 +1,194 @@
 """MCP server implementation for Conduit"""
 
-from typing import Dict, List, Optional
+import functools
+import threading
+from typing import Dict, List, Optional, Tuple
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.server.stdio import stdio_server
 import mcp.types as types
 import logging
-import json
+import re
 import sys
 from urllib.parse import unquote
-import asyncio
 import anyio
 import click
 
 from conduit.core.services import ConfigService, ConfluenceService
-from conduit.core.config import load_config
+from conduit.core.config import Config, clear_config_cache, load_config
+from conduit.core.serialization import to_json_line
+from conduit.mcp import _run
+from conduit.platforms.confluence.content import format_markdown
+from conduit.core.exceptions import PlatformError
+from conduit.platforms.registry import PlatformRegistry
 
-# Configure logging to write to stderr instead of a file
-logging.basicConfig(
-    stream=sys.stderr,  # Write to stderr instead of a file
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+logger = logging.getLogger("conduit.mcp")
+
+# Issue keys that are safe to quote into a JQL query
+_ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
+
+
+def _configure_logging(level: int = logging.DEBUG) -> None:
+    """Send all log output to stderr, keeping stdout free for the protocol.
+
+    Called when the server starts rather than on import, so importing this
+    module does not replace the host process's logging handlers.
+    """
+    root_logger = logging.getLogger()
+
+    # Remove any existing handlers
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+
+    # Add stderr handler to root logger
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setLevel(level)
+    stderr_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    root_logger.addHandler(stderr_handler)
+    root_logger.setLevel(level)
+
+    # Enable debug logging for all relevant loggers
+    for name in ("conduit.mcp", "mcp.server", "uvicorn"):
+        logging.getLogger(name).setLevel(level)
+
+
+# Serializes client creation so concurrent first uses of a site share one client
+_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _connect(platform_name: str, site_alias: str):
+    """Create and connect the client for one site."""
+    client = PlatformRegistry.get_platform(platform_name, site_alias=site_alias)
+    client.connect()
+    return client
+
+
+def _connected_client(platform_name: str, site_alias: Optional[str]):
+    """Get a connected platform client, connecting on first use.
+
+    The server is long-running, so clients are kept per (platform, site alias)
+    instead of reconnecting on every tool call. Calls without a site alias
+    share the default site's client.
+    """
+    if site_alias is None:
+        site_alias = getattr(load_config(), platform_name).default_site_alias
+    with _client_lock:
+        return _connect(platform_name, site_alias)
+
+
+def _clear_clients() -> None:
+    """Forget all connected clients so they are recreated on next use."""
+    with _client_lock:
+        _connect.cache_clear()
+
+
+def _warm_clients() -> None:
+    """Create the clients for every configured site in the background.
+
+    Tool calls then find their client ready instead of building it on first
+    use. Sites that fail to load are left for the tool call to report.
+    """
+
+    def warm(platform_name: str, site_alias: Optional[str]) -> None:
+        try:
+            _connected_client(platform_name, site_alias)
+        except Exception as e:
+            logger.debug("Could not warm %s site %s: %s", platform_name, site_alias, e)
+
+    def warm_all() -> None:
+        try:
+            config = load_config()
+        except Exception as e:
+            logger.debug("Skipping client warm-up: %s", e)
+            return
+        # Connecting only builds the client objects, so the sites are warmed
+        # one at a time under the same lock the tool calls take
+        for platform_name, platform_config in (
+            ("jira", config.jira),
+            ("confluence", config.confluence),
+        ):
+            for site_alias in platform_config.sites:
+                warm(platform_name, site_alias)
+
+    threading.Thread(target=warm_all, name="conduit-warm-clients", daemon=True).start()
+
+
+async def _in_thread(func, *args, **kwargs):
+    """Run a blocking client call in a worker thread.
+
+    The platform clients use blocking HTTP requests. Running them off the
+    event loop lets the server work on several tool calls at once.
+    """
+    return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs))
+
+
+# Markdown returned by get_confluence_page
+_PAGE_TEMPLATE = (
+    "# {title}\n\n"
+    "**Page Details:**\n"
+    "- ID: {id}\n"
+    "- Version: {version}\n"
+    "- Last Updated: {when}\n\n"
+    "**Content:**\n"
+    "{content}"
 )
 
-# Get all relevant loggers
-logger = logging.getLogger("conduit.mcp")
-mcp_logger = logging.getLogger("mcp.server")
-uvicorn_logger = logging.getLogger("uvicorn")
-root_logger = logging.getLogger()
 
-# Remove any existing handlers
-for handler in root_logger.handlers[:]:
-    root_logger.removeHandler(handler)
+# Last config served by list_config and its sanitized JSON
+_sanitized_config: Optional[Tuple[Config, str]] = None
+
+
+def _sanitized_config_json(config: Config) -> str:
+    """Get the config as JSON with API tokens masked.
 
-# Add stderr handler to root logger
-stderr_handler = logging.StreamHandler(sys.stderr)
-stderr_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-stderr_handler.setFormatter(formatter)
-root_logger.addHandler(stderr_handler)
+    load_config() returns the same object until the file changes, so the JSON
+    is only rebuilt after the config has been reloaded.
+    """
+    global _sanitized_config
+    if _sanitized_config is not None and _sanitized_config[0] is config:
+        return _sanitized_config[1]
 
-# Enable debug logging for all relevant loggers
-logger.setLevel(logging.DEBUG)
-mcp_logger.setLevel(logging.DEBUG)
-uvicorn_logger.setLevel(logging.DEBUG)
+    def sites(platform_config) -> Dict[str, Dict[str, str]]:
+        return {
+            alias: {"url": site.url, "email": site.email, "api_token": "****"}
+            for alias, site in platform_config.sites.items()
+        }
 
+    config_dict = {
+        "jira": {
+            "default_site_alias": config.jira.default_site_alias,
+            "sites": sites(config.jira),
+        },
+        "confluence": {
+            "default_site_alias": config.confluence.default_site_alias,
+            "sites": sites(config.confluence),
+        },
+    }
+    text = to_json_line(config_dict)
+    _sanitized_config = (config, text)
+    return text
 
-def create_mcp_server() -> FastMCP:
-    """Create and configure the MCP server instance"""
+
+def create_mcp_server(port: int = 8000) -> FastMCP:
+    """Create and configure the MCP server instance
+
+    Args:
+        port: Port the SSE transport listens on (default: 8000)
+    """
     logger.info("Creating FastMCP server")
     server = FastMCP(
         "Conduit",
         host="localhost",
-        port=8000,
+        port=port,
         debug=True,
         log_level="DEBUG",
     )
     logger.info("FastMCP server instance created")
-    logger.debug(f"Server attributes: {dir(server)}")
-    logger.debug(f"Server configuration: {vars(server)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Server attributes: %s", dir(server))
+        logger.debug("Server configuration: %s", vars(server))
 
     # Register all tools with the server
     register_tools(server)
@@ -73,39 +204,39 @@ def register_tools(mcp_server: FastMCP) -> None:
         """List all configured Jira and Confluence sites"""
         try:
             logger.debug("Executing list_config tool")
-            config = load_config()
-
-            config_dict = {
-                "jira": {
-                    "default_site_alias": config.jira.default_site_alias,
-                    "sites": {
-                        alias: {
-                            "url": site.url,
-                            "email": site.email,
-                            "api_token": "****",
-                        }
-                        for alias, site in config.jira.sites.items()
-                    },
-                },
-                "confluence": {
-                    "default_site_alias": config.confluence.default_site_alias,
-                    "sites": {
-                        alias: {
-                            "url": site.url,
-                            "email": site.email,
-                            "api_token": "****",
-                        }
-                        for alias, site in config.confluence.sites.items()
-                    },
-                },
-            }
-
-            logger.debug(f"list_config result: {config_dict}")
-            return [types.TextContent(type="text", text=str(config_dict))]
+            text = _sanitized_config_json(load_config())
+            logger.debug("list_config result: %s", text)
+            return [types.TextContent(type="text", text=text)]
         except Exception as e:
             logger.error(f"Error in list_config: {e}", exc_info=True)
             raise
 
+    @mcp_server.tool()
+    async def reload_config() -> list[types.TextContent]:
+        """Reload the configuration file and reconnect to all sites on next use"""
+        try:
+            logger.debug("Executing reload_config tool")
+            clear_config_cache()
+            _clear_clients()
+            text = _sanitized_config_json(load_config())
+            return [types.TextContent(type="text", text=text)]
+        except Exception as e:
+            logger.error(f"Error in reload_config: {e}", exc_info=True)
+            raise
+
+    @mcp_server.tool()
+    async def clear_cache(site_alias: Optional[str] = None) -> list[types.TextContent]:
+        """Forget Confluence pages cached in memory so they are fetched again"""
+        try:
+            logger.debug("Executing clear_cache tool with site %s", site_alias)
+            _connected_client("confluence", site_alias).clear_cache()
+            return [
+                types.TextContent(type="text", text="Confluence page cache cleared")
+            ]
+        except Exception as e:
+            logger.error(f"Error in clear_cache: {e}", exc_info=True)
+            raise
+
     @mcp_server.tool()
     async def get_confluence_page(
         space_key: str, title: str, site_alias: Optional[str] = None
@@ -113,75 +244,39 @@ def register_tools(mcp_server: FastMCP) -> None:
         """Get Confluence page content by title within a space"""
         try:
             logger.debug(
-                f"Executing get_confluence_page for page '{title}' in space {space_key} with site {site_alias}"
+                "Executing get_confluence_page for page '%s' in space %s with site %s",
+                title,
+                space_key,
+                site_alias,
             )
-            # Get the Confluence client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("confluence", site_alias=site_alias)
-            client.connect()
+            # Get the connected Confluence client
+            client = _connected_client("confluence", site_alias)
 
             # Get page using the client
-            page = client.get_page_by_title(space_key, title)
+            page = await _in_thread(client.get_page_by_title, space_key, title)
             if not page:
                 raise ValueError(f"Page '{title}' not found in space {space_key}")
 
             # Get the raw content and clean it
-            raw_content = page.get("body", {}).get("storage", {}).get("value", "")
-            clean_content = client.content_cleaner.clean(raw_content)
-
-            # Process the clean content to improve table formatting
-            lines = clean_content.split("\n")
-            formatted_lines = []
-            in_table = False
-
-            for line in lines:
-                # Detect table header separator and format it properly
-                if line.startswith("---------"):
-                    in_table = True
-                    # Count the number of columns from the previous line
-                    prev_line = formatted_lines[-1] if formatted_lines else ""
-                    num_columns = prev_line.count("|") + 1
-                    formatted_lines.append("|" + " --- |" * num_columns)
-                    continue
-
-                # Add proper spacing around headings
-                if line.startswith("**") and line.endswith("**"):
-                    formatted_lines.extend(["", line, ""])
-                    continue
-
-                # Ensure table rows have proper spacing
-                if "|" in line:
-                    in_table = True
-                    # Clean up table row formatting
-                    cells = [cell.strip() for cell in line.split("|")]
-                    formatted_lines.append("| " + " | ".join(cells) + " |")
-                    continue
-
-                # Add extra line break after table
-                if in_table and not line.strip():
-                    in_table = False
-                    formatted_lines.extend(["", ""])
-                    continue
-
-                formatted_lines.append(line)
-
-            # Build the markdown content parts separately
-            title_section = f"# {page['title']}"
-            details_section = (
-                "**Page Details:**\n"
-                f"- ID: {page['id']}\n"
-                f"- Version: {page.get('version', {}).get('number', 'Unknown')}\n"
-                f"- Last Updated: {page.get('version', {}).get('when', 'Unknown')}"
+            try:
+                raw_content = page["body"]["storage"]["value"]
+            except KeyError:
+                raw_content = ""
+            clean_content = await _in_thread(client.content_cleaner.clean, raw_content)
+
+            # Fill the page template in one pass
+            version = page.get("version") or {}
+            markdown = _PAGE_TEMPLATE.format(
+                title=page["title"],
+                id=page["id"],
+                version=version.get("number", "Unknown"),
+                when=version.get("when", "Unknown"),
+                content=format_markdown(clean_content),
             )
-            content_section = "**Content:**"
-            formatted_content = "\n".join(formatted_lines)
-
-            # Combine all sections with proper spacing
-            markdown = f"{title_section}\n\n{details_section}\n\n{content_section}\n{formatted_content}"
 
             logger.debug(
-                f"get_confluence_page formatted {len(markdown)} characters of content as markdown"
+                "get_confluence_page formatted %s characters of content as markdown",
+                len(markdown),
             )
             return [types.TextContent(type="text", text=markdown)]
         except Exception as e:
@@ -190,23 +285,32 @@ def register_tools(mcp_server: FastMCP) -> None:
 
     @mcp_server.tool()
     async def search_jira_issues(
-        query: str, site_alias: Optional[str] = None
+        query: str,
+        limit: int = 50,
+        fields: str = "key,summary,status",
+        site_alias: Optional[str] = None,
     ) -> list[types.TextContent]:
-        """Search Jira issues using JQL syntax"""
+        """Search Jira issues using JQL syntax.
+
+        Returns at most `limit` issues with only the comma-separated `fields`
+        (default: key, summary and status); pass "*all" for every field.
+        """
         try:
             logger.debug(
-                f"Executing search_jira_issues tool with query '{query}' and site {site_alias}"
+                "Executing search_jira_issues tool with query '%s', limit %s and site %s",
+                query,
+                limit,
+                site_alias,
             )
-            # Get the Jira client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("jira", site_alias=site_alias)
-            client.connect()
+            # Get the connected Jira client
+            client = _connected_client("jira", site_alias)
 
             # Search using the client
-            results = client.search(query)
-            logger.debug(f"search_jira_issues found {len(results)} issues")
-            return [types.TextContent(type="text", text=str(results))]
+            results = await _in_thread(
+                client.search, query, fields=fields.split(","), limit=limit
+            )
+            logger.debug("search_jira_issues found %s issues", len(results))
+            return [types.TextContent(type="text", text=to_json_line(results))]
         except Exception as e:
             logger.error(f"Error in search_jira_issues: {e}", exc_info=True)
             raise
@@ -222,23 +326,24 @@ def register_tools(mcp_server: FastMCP) -> None:
         """Create a new Jira issue"""
         try:
             logger.debug(
-                f"Executing create_jira_issue tool for project '{project}' with type '{issue_type}' and site {site_alias}"
+                "Executing create_jira_issue tool for project '%s' with type '%s' and site %s",
+                project,
+                issue_type,
+                site_alias,
             )
-            # Get the Jira client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("jira", site_alias=site_alias)
-            client.connect()
+            # Get the connected Jira client
+            client = _connected_client("jira", site_alias)
 
             # Create the issue using the client with proper field structure
-            result = client.create(
+            result = await _in_thread(
+                client.create,
                 project={"key": project},
                 summary=summary,
                 description=description,
                 issuetype={"name": issue_type},
             )
-            logger.debug(f"create_jira_issue created issue: {result}")
-            return [types.TextContent(type="text", text=str(result))]
+            logger.debug("create_jira_issue created issue: %s", result)
+            return [types.TextContent(type="text", text=to_json_line(result))]
         except Exception as e:
             logger.error(f"Error in create_jira_issue: {e}", exc_info=True)
             raise
@@ -253,24 +358,23 @@ def register_tools(mcp_server: FastMCP) -> None:
         """Update an existing Jira issue"""
         try:
             logger.debug(
-                f"Executing update_jira_issue tool for issue '{key}' with site {site_alias}"
+                "Executing update_jira_issue tool for issue '%s' with site %s",
+                key,
+                site_alias,
             )
-            # Get the Jira client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("jira", site_alias=site_alias)
-            client.connect()
+            # Get the connected Jira client
+            client = _connected_client("jira", site_alias)
 
             # Build update fields dictionary
             fields = {"summary": summary, "description": description}
 
             # Update the issue using the client
-            client.update(key, **fields)
+            await _in_thread(client.update, key, **fields)
 
             # Get and return the updated issue
-            updated_issue = client.get(key)
-            logger.debug(f"update_jira_issue updated issue: {updated_issue}")
-            return [types.TextContent(type="text", text=str(updated_issue))]
+            updated_issue = await _in_thread(client.get, key)
+            logger.debug("update_jira_issue updated issue: %s", updated_issue)
+            return [types.TextContent(type="text", text=to_json_line(updated_issue))]
         except Exception as e:
             logger.error(f"Error in update_jira_issue: {e}", exc_info=True)
             raise
@@ -284,21 +388,21 @@ def register_tools(mcp_server: FastMCP) -> None:
         """Update a Jira issue's status"""
         try:
             logger.debug(
-                f"Executing update_jira_status tool for issue '{key}' with new status '{status}' and site {site_alias}"
+                "Executing update_jira_status tool for issue '%s' with new status '%s' and site %s",
+                key,
+                status,
+                site_alias,
             )
-            # Get the Jira client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("jira", site_alias=site_alias)
-            client.connect()
+            # Get the connected Jira client
+            client = _connected_client("jira", site_alias)
 
             # Transition the issue status using the client
-            client.transition_status(key, status)
+            await _in_thread(client.transition_status, key, status)
 
             # Get and return the updated issue
-            updated_issue = client.get(key)
-            logger.debug(f"update_jira_status updated issue: {updated_issue}")
-            return [types.TextContent(type="text", text=str(updated_issue))]
+            updated_issue = await _in_thread(client.get, key)
+            logger.debug("update_jira_status updated issue: %s", updated_issue)
+            return [types.TextContent(type="text", text=to_json_line(updated_issue))]
         except Exception as e:
             logger.error(f"Error in update_jira_status: {e}", exc_info=True)
             raise
@@ -311,16 +415,15 @@ def register_tools(mcp_server: FastMCP) -> None:
         """Get all Jira boards, optionally filtered by project"""
         try:
             logger.debug(
-                f"Executing get_jira_boards tool{f' for project {project_key}' if project_key else ''} with site {site_alias}"
+                "Executing get_jira_boards tool for project %s with site %s",
+                project_key,
+                site_alias,
             )
-            # Get the Jira client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("jira", site_alias=site_alias)
-            client.connect()
+            # Get the connected Jira client
+            client = _connected_client("jira", site_alias)
 
             # Get boards using the client
-            boards = client.get_boards(project_key)
+            boards = await _in_thread(client.get_boards, project_key)
 
             # Format the response as markdown
             markdown_response = "# Jira Boards\n\n"
@@ -339,7 +442,7 @@ def register_tools(mcp_server: FastMCP) -> None:
                         f"  - Location: {board.get('location', {}).get('projectName', 'Unknown Project')}\n"
                     )
 
-            logger.debug(f"get_jira_boards found {len(boards)} boards")
+            logger.debug("get_jira_boards found %s boards", len(boards))
             return [types.TextContent(type="text", text=markdown_response)]
         except Exception as e:
             logger.error(f"Error in get_jira_boards: {e}", exc_info=True)
@@ -354,16 +457,16 @@ def register_tools(mcp_server: FastMCP) -> None:
         """Get all sprints from a Jira board, optionally filtered by state"""
         try:
             logger.debug(
-                f"Executing get_jira_sprints tool for board {board_id}{f' with state {state}' if state else ''} and site {site_alias}"
+                "Executing get_jira_sprints tool for board %s with state %s and site %s",
+                board_id,
+                state,
+                site_alias,
             )
-            # Get the Jira client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("jira", site_alias=site_alias)
-            client.connect()
+            # Get the connected Jira client
+            client = _connected_client("jira", site_alias)
 
             # Get sprints using the client
-            sprints = client.get_sprints(board_id, state)
+            sprints = await _in_thread(client.get_sprints, board_id, state)
 
             # Format the response as markdown
             markdown_response = "# Jira Sprints\n\n"
@@ -385,7 +488,7 @@ def register_tools(mcp_server: FastMCP) -> None:
                         f"  - End Date: {sprint.get('endDate', 'Not set')}\n"
                     )
 
-            logger.debug(f"get_jira_sprints found {len(sprints)} sprints")
+            logger.debug("get_jira_sprints found %s sprints", len(sprints))
             return [types.TextContent(type="text", text=markdown_response)]
         except Exception as e:
             logger.error(f"Error in get_jira_sprints: {e}", exc_info=True)
@@ -400,28 +503,51 @@ def register_tools(mcp_server: FastMCP) -> None:
         """Add one or more Jira issues to a sprint"""
         try:
             logger.debug(
-                f"Executing add_issues_to_jira_sprint tool for sprint {sprint_id} with issues {issue_keys} and site {site_alias}"
+                "Executing add_issues_to_jira_sprint tool for sprint %s with issues %s and site %s",
+                sprint_id,
+                issue_keys,
+                site_alias,
             )
-            # Get the Jira client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("jira", site_alias=site_alias)
-            client.connect()
+            # Get the connected Jira client
+            client = _connected_client("jira", site_alias)
 
             # Add issues to sprint
-            client.add_issues_to_sprint(sprint_id, issue_keys)
+            await _in_thread(client.add_issues_to_sprint, sprint_id, issue_keys)
 
             # Format the response as markdown
             markdown_response = "# Issues Added to Sprint\n\n"
             markdown_response += (
                 f"Successfully added the following issues to sprint {sprint_id}:\n\n"
             )
+            # Fetch every summary with one search instead of a request per issue.
+            # The issues are already in the sprint, so a failed lookup only
+            # leaves their summaries out.
+            valid_keys = [key for key in issue_keys if _ISSUE_KEY.match(key)]
+            summaries = {}
+            if valid_keys:
+                keys = ", ".join(f'"{key}"' for key in valid_keys)
+                try:
+                    issues = await _in_thread(
+                        client.search,
+                        f"key in ({keys})",
+                        fields=["summary"],
+                        limit=len(valid_keys),
+                    )
+                    summaries = {
+                        issue["key"]: (issue.get("fields") or {}).get("summary")
+                        for issue in issues
+                    }
+                except PlatformError as e:
+                    logger.warning(f"Could not fetch summaries for sprint issues: {e}")
             for key in issue_keys:
-                issue = client.get(key)
-                markdown_response += f"- **{key}**: {issue.get('fields', {}).get('summary', 'No summary')}\n"
+                markdown_response += (
+                    f"- **{key}**: {summaries.get(key) or 'No summary'}\n"
+                )
 
             logger.debug(
-                f"add_issues_to_jira_sprint added {len(issue_keys)} issues to sprint {sprint_id}"
+                "add_issues_to_jira_sprint added %s issues to sprint %s",
+                len(issue_keys),
+                sprint_id,
             )
             return [types.TextContent(type="text", text=markdown_response)]
         except Exception as e:
@@ -430,27 +556,32 @@ def register_tools(mcp_server: FastMCP) -> None:
 
     @mcp_server.tool()
     async def list_all_confluence_pages(
-        space_key: str, batch_size: int = 100, site_alias: Optional[str] = None
+        space_key: str, batch_size: int = 1000, site_alias: Optional[str] = None
     ) -> list[types.TextContent]:
         """List all pages in a Confluence space with pagination support"""
         try:
             logger.debug(
-                f"Executing list_all_confluence_pages tool for space {space_key} with site {site_alias} and batch_size {batch_size}"
+                "Executing list_all_confluence_pages tool for space %s with site %s and batch_size %s",
+                space_key,
+                site_alias,
+                batch_size,
             )
-            # Get the Confluence client from the registry
-            from conduit.platforms.registry import PlatformRegistry
-
-            client = PlatformRegistry.get_platform("confluence", site_alias=site_alias)
-            client.connect()
+            # Get the connected Confluence client
+            client = _connected_client("confluence", site_alias)
 
             # Get all pages using pagination
-            pages = client.get_all_pages_by_space(space_key, batch_size=batch_size)
-            logger.debug(f"list_all_confluence_pages found {len(pages)} pages")
+            pages = await _in_thread(
+                client.get_all_pages_by_space, space_key, batch_size=batch_size
+            )
+            logger.debug("list_all_confluence_pages found %s pages", len(pages))
 
             # Format response as markdown
-            markdown_response = f"\nFound {len(pages)} pages in space {space_key}:\n"
-            for page in pages:
-                markdown_response += f"- {page.get('title')} (ID: {page.get('id')})\n"
+            markdown_response = (
+                f"\nFound {len(pages)} pages in space {space_key}:\n"
+                + "".join(
+                    f"- {page.get('title')} (ID: {page.get('id')})\n" for page in pages
+                )
+            )
 
             return [types.TextContent(type="text", text=markdown_response)]
         except Exception as e:
@@ -472,11 +603,13 @@ server = create_mcp_server()
 )
 def main(port: int, transport: str) -> int:
     """Entry point for the MCP server"""
+    _configure_logging()
+    _warm_clients()
     try:
         if transport == "stdio":
-            asyncio.run(server.run_stdio_async())
+            _run(server.run_stdio_async())
         else:
-            asyncio.run(server.run_sse_async())
+            _run(create_mcp_server(port=port).run_sse_async())
         return 0
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
@@ -1,12 +1,47 @@
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Any
+import requests
 from atlassian import Confluence
+from atlassian.errors import ApiError
 
+from conduit.core.cache import ResponseCache, TTLCache
 from conduit.core.config import load_config
 from conduit.core.logger import logger
 from conduit.core.exceptions import ConfigurationError, PlatformError
+from conduit.platforms.session import create_session
 from conduit.platforms.base import Platform
 from conduit.platforms.confluence.content import ConfluenceContentCleaner
 
+# Default number of pages requested per batch
+DEFAULT_BATCH_SIZE = 1000
+
+# Smallest per-request page limit Confluence is expected to enforce
+MIN_SERVER_PAGE_LIMIT = 100
+
+# Seconds a page fetched by title is reused before it is fetched again
+PAGE_CACHE_TTL = 300
+
+# Threads in the pool shared by concurrent page fetches
+PAGE_FETCH_THREADS = 8
+
+# Parent page IDs combined into one CQL "parent in (...)" query
+CQL_PARENT_CHUNK_SIZE = 100
+
+
+@lru_cache(maxsize=1)
+def _page_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by every client's concurrent page fetches.
+
+    The pool is created on first use and reused, so repeated space listings
+    in one process do not start and stop threads each time. Its tasks are
+    single requests that never wait on each other, so callers sharing it
+    cannot deadlock.
+    """
+    return ThreadPoolExecutor(
+        max_workers=PAGE_FETCH_THREADS, thread_name_prefix="confluence"
+    )
+
 
 class ConfluenceClient(Platform):
     """Client for interacting with Confluence."""
@@ -17,6 +52,8 @@ class ConfluenceClient(Platform):
             self.site_config = self.config.get_site_config(site_alias)
             self.confluence = None
             self.content_cleaner = ConfluenceContentCleaner()
+            self.cache = ResponseCache()
+            self.page_cache = TTLCache(maxsize=1024, ttl=PAGE_CACHE_TTL)
             logger.info(
                 f"Initialized Confluence client for site: {site_alias or 'default'}"
             )
@@ -34,6 +71,7 @@ class ConfluenceClient(Platform):
                     username=self.site_config.email,
                     password=self.site_config.api_token,
                     cloud=True,
+                    session=create_session(),
                 )
                 logger.info("Connected to Confluence successfully.")
         except Exception as e:
@@ -45,6 +83,10 @@ class ConfluenceClient(Platform):
         self.confluence = None
         logger.info("Disconnected from Confluence.")
 
+    def clear_cache(self) -> None:
+        """Forget pages cached in memory by get_page_by_title."""
+        self.page_cache.clear()
+
     def get_pages_by_space(
         self, space_key: str, limit: int = 100, expand: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -88,19 +130,108 @@ class ConfluenceClient(Platform):
                 logger.error(f"Response body: {e.response.text}")
             raise PlatformError(f"Failed to get pages for space {space_key}: {e}")
 
-    def get_all_pages_by_space(
-        self, space_key: str, expand: Optional[str] = None, batch_size: int = 100
+    def _get_pages_batch(
+        self, space_key: str, start: int, limit: int, expand: Optional[str]
     ) -> List[Dict[str, Any]]:
+        """Fetch a single batch of pages from a space."""
+        logger.debug(f"Fetching pages starting at offset: {start}")
+        return self.confluence.get_all_pages_from_space(
+            space=space_key,
+            start=start,
+            limit=limit,
+            content_type="page",
+            expand=expand or "version",
+        )
+
+    def _space_fingerprint(self, space_key: str) -> Optional[List[Any]]:
+        """Fingerprint the pages of a space with a single search request.
+
+        The page count changes when pages are added or removed, and the most
+        recently modified page changes when any page is edited.
+
+        Returns:
+            The fingerprint, or None if the search fails or reports no count
         """
-        Get all pages in a given space using pagination.
+        quoted_key = space_key.replace("\\", "\\\\").replace('"', '\\"')
+        try:
+            result = self.confluence.cql(
+                f'space = "{quoted_key}" and type = page order by lastmodified desc',
+                limit=1,
+            )
+        except (requests.RequestException, ApiError, ValueError) as e:
+            logger.debug(f"Could not fingerprint space {space_key}: {e}")
+            return None
+        if not isinstance(result, dict) or result.get("totalSize") is None:
+            logger.debug(f"Search returned no page count for space {space_key}")
+            return None
+        latest = (result.get("results") or [{}])[0]
+        return [
+            result["totalSize"],
+            latest.get("content", {}).get("id"),
+            latest.get("lastModified"),
+        ]
+
+    def _cached_pages(
+        self,
+        key: tuple,
+        space_key: str,
+        fetch: Callable[[Optional[int]], Iterator[Dict[str, Any]]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield pages from the on-disk cache while the space is unchanged.
+
+        On a miss the pages are fetched, yielded as they arrive and stored once
+        the last one has been yielded. fetch is passed the space's page count
+        from the fingerprint, or None when it is unknown. Search counts can
+        lag behind the space, so a listing whose length disagrees with the
+        count is not stored.
+        """
+        validator = self._space_fingerprint(space_key)
+        if validator is not None:
+            cached = self.cache.get(key, validator)
+            if cached is not None:
+                logger.info(f"Using cached pages for space {space_key}")
+                yield from cached
+                return
+
+        pages = []
+        total = validator[0] if validator is not None else None
+        for page in fetch(total):
+            pages.append(page)
+            yield page
+        if validator is not None and len(pages) == total:
+            self.cache.set(key, validator, pages)
+        elif validator is not None:
+            logger.debug(
+                f"Not caching {len(pages)} pages for space {space_key}: "
+                f"search reported {total}"
+            )
+
+    def iter_all_pages_by_space(
+        self,
+        space_key: str,
+        expand: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = 8,
+        use_cache: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all pages in a given space, yielding each batch as it arrives.
+
+        The first batch is fetched on its own. If the space holds more pages,
+        the following batches are fetched concurrently, up to max_workers at
+        a time, until a batch comes back short. Pages are yielded in order.
 
         Args:
             space_key: The key of the space to get pages from
-            expand: Optional comma-separated list of properties to expand
-            batch_size: Number of pages to fetch per request (default: 100)
+            expand: Comma-separated list of properties to expand (default:
+                "version"). Pass "version,body.storage" to include page bodies.
+            batch_size: Number of pages to fetch per request (default: 1000)
+            max_workers: Maximum number of concurrent requests, at most the
+                shared pool's 8 threads (default: 8)
+            use_cache: Serve unchanged spaces from the on-disk cache (default: True)
 
-        Returns:
-            List of all pages with their details
+        Yields:
+            Pages with their details
 
         Raises:
             PlatformError: If the operation fails
@@ -108,34 +239,77 @@ class ConfluenceClient(Platform):
         if not self.confluence:
             raise PlatformError("Not connected to Confluence")
 
+        def fetch(total: Optional[int] = None):
+            return self._iter_all_pages(
+                space_key, expand, batch_size, max_workers, total
+            )
+
+        if not use_cache:
+            return fetch()
+        key = ("all_pages", self.site_config.url, space_key, expand)
+        return self._cached_pages(key, space_key, fetch)
+
+    def _iter_all_pages(
+        self,
+        space_key: str,
+        expand: Optional[str],
+        batch_size: int,
+        max_workers: int,
+        total: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch all pages in a space, batches after the first concurrently.
+
+        The listing ends at the first short batch. When the space's page count
+        is known it only sizes each round of concurrent requests, so an
+        outdated count can cost an extra request but never truncates the
+        listing.
+        """
         try:
             logger.info(f"Getting all pages for space: {space_key}")
             logger.debug(f"Using expand parameters: {expand}")
 
-            all_pages = []
-            start = 0
-
-            while True:
-                logger.debug(f"Fetching pages starting at offset: {start}")
-                pages = self.confluence.get_all_pages_from_space(
-                    space=space_key,
-                    start=start,
-                    limit=batch_size,
-                    content_type="page",
-                    expand=expand or "version,body.storage",
+            pages = self._get_pages_batch(space_key, 0, batch_size, expand)
+            yield from pages
+            start = len(pages)
+            done = len(pages) < batch_size
+
+            # Confluence may return fewer pages than requested when the batch
+            # size exceeds its own limit, so a short first batch could be that
+            # limit rather than the end of the space. One more request tells
+            # them apart.
+            if MIN_SERVER_PAGE_LIMIT <= len(pages) < batch_size:
+                pages = self._get_pages_batch(space_key, start, batch_size, expand)
+                if pages:
+                    logger.warning(
+                        f"Confluence returned at most {start} pages per request; "
+                        f"using that instead of batch size {batch_size}"
+                    )
+                    batch_size = start
+                    yield from pages
+                    start += len(pages)
+                    done = len(pages) < batch_size
+
+            executor = _page_executor()
+            while not done:
+                round_size = max_workers
+                if total is not None:
+                    # Ask for the batches the count predicts, or a single one
+                    # to confirm the end once it has been reached
+                    remaining = -(-(total - start) // batch_size)
+                    round_size = min(max_workers, max(1, remaining))
+                offsets = [start + i * batch_size for i in range(round_size)]
+                batches = executor.map(
+                    lambda offset: self._get_pages_batch(
+                        space_key, offset, batch_size, expand
+                    ),
+                    offsets,
                 )
-
-                if not pages:
-                    break
-
-                all_pages.extend(pages)
-                start += len(pages)
-
-                if len(pages) < batch_size:
-                    break
-
-            logger.info(f"Found total of {len(all_pages)} pages in space {space_key}")
-            return all_pages
+                for pages in batches:
+                    yield from pages
+                    if len(pages) < batch_size:
+                        done = True
+                        break
+                start += len(offsets) * batch_size
 
         except Exception as e:
             logger.error(f"Failed to get all pages for space {space_key}: {e}")
@@ -144,6 +318,40 @@ class ConfluenceClient(Platform):
                 logger.error(f"Response body: {e.response.text}")
             raise PlatformError(f"Failed to get all pages for space {space_key}: {e}")
 
+    def get_all_pages_by_space(
+        self,
+        space_key: str,
+        expand: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = 8,
+        use_cache: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all pages in a given space using pagination.
+
+        Args:
+            space_key: The key of the space to get pages from
+            expand: Comma-separated list of properties to expand (default:
+                "version"). Pass "version,body.storage" to include page bodies.
+            batch_size: Number of pages to fetch per request (default: 1000)
+            max_workers: Maximum number of concurrent requests, at most the
+                shared pool's 8 threads (default: 8)
+            use_cache: Serve unchanged spaces from the on-disk cache (default: True)
+
+        Returns:
+            List of all pages with their details
+
+        Raises:
+            PlatformError: If the operation fails
+        """
+        all_pages = list(
+            self.iter_all_pages_by_space(
+                space_key, expand, batch_size, max_workers, use_cache
+            )
+        )
+        logger.info(f"Found total of {len(all_pages)} pages in space {space_key}")
+        return all_pages
+
     def get_child_pages(
         self, parent_id: str, limit: int = 100, expand: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -185,6 +393,59 @@ class ConfluenceClient(Platform):
                 f"Failed to get child pages for parent {parent_id}: {e}"
             )
 
+    def get_child_pages_bulk(
+        self, parent_ids: List[str], batch_size: int = 200
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the child pages of several parent pages with CQL searches.
+
+        Parents are combined into "parent in (...)" queries of up to 100 IDs,
+        so N parents take about N/100 searches instead of N requests.
+
+        Args:
+            parent_ids: The IDs of the parent pages
+            batch_size: Number of results to request per search (default: 200)
+
+        Returns:
+            Child pages keyed by parent ID. Every requested parent has an
+            entry, which is empty if it has no children.
+
+        Raises:
+            PlatformError: If a parent ID is not numeric or a search fails
+        """
+        if not self.confluence:
+            raise PlatformError("Not connected to Confluence")
+
+        invalid = [pid for pid in parent_ids if not str(pid).isdigit()]
+        if invalid:
+            raise PlatformError(f"Invalid page IDs: {', '.join(invalid)}")
+
+        children = {str(pid): [] for pid in parent_ids}
+        try:
+            for i in range(0, len(parent_ids), CQL_PARENT_CHUNK_SIZE):
+                chunk = parent_ids[i : i + CQL_PARENT_CHUNK_SIZE]
+                cql = f"type = page and parent in ({', '.join(map(str, chunk))})"
+                logger.debug(f"Searching child pages with CQL: {cql}")
+                start = 0
+                while True:
+                    result = self.confluence.cql(
+                        cql, start=start, limit=batch_size, expand="content.ancestors"
+                    )
+                    results = result.get("results", []) if result else []
+                    for item in results:
+                        page = item["content"]
+                        # The last ancestor is the direct parent
+                        parent_id = page["ancestors"][-1]["id"]
+                        children.setdefault(parent_id, []).append(page)
+                    start += len(results)
+                    if not results or start >= result.get("totalSize", start):
+                        break
+            return children
+        except Exception as e:
+            ids = ", ".join(map(str, parent_ids))
+            logger.error(f"Failed to get child pages for parents {ids}: {e}")
+            raise PlatformError(f"Failed to get child pages for parents {ids}: {e}")
+
     def get_space_content(
         self,
         space_key: str,
@@ -250,16 +511,94 @@ class ConfluenceClient(Platform):
                 logger.error(f"Response body: {e.response.text}")
             raise PlatformError(f"Failed to get content for space {space_key}: {e}")
 
+    def iter_space_content(
+        self,
+        space_key: str,
+        depth: str = "all",
+        batch_size: int = 100,
+        expand: str = "body.storage",
+        format: str = "storage",
+        use_cache: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the pages of a space's content, one batch at a time.
+
+        Args:
+            space_key: The key of the space to get content from
+            depth: Depth of the content tree to return (default: "all")
+            batch_size: Number of pages to fetch per request (default: 100)
+            expand: Comma-separated list of properties to expand (default: "body.storage")
+            format: Content format to return, "storage" or "clean" (default: "storage")
+            use_cache: Serve unchanged spaces from the on-disk cache. Only
+                listings with depth "all" are cached (default: True)
+
+        Yields:
+            Pages with their expanded details
+
+        Raises:
+            PlatformError: If the operation fails
+            ValueError: If an invalid format is specified
+        """
+        if format not in ["storage", "clean"]:
+            raise ValueError('format must be either "storage" or "clean"')
+        if not self.confluence:
+            raise PlatformError("Not connected to Confluence")
+
+        def fetch(total: Optional[int] = None):
+            return self._iter_space_content(
+                space_key, depth, batch_size, expand, format
+            )
+
+        # Only a full listing can be checked against the space's page count
+        if not use_cache or depth != "all":
+            return fetch()
+        key = ("space_content", self.site_config.url, space_key, depth, expand, format)
+        return self._cached_pages(key, space_key, fetch)
+
+    def _iter_space_content(
+        self,
+        space_key: str,
+        depth: str,
+        batch_size: int,
+        expand: str,
+        format: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch a space's content by paging through get_space_content."""
+        start = 0
+        while True:
+            content = self.get_space_content(
+                space_key,
+                depth=depth,
+                start=start,
+                limit=batch_size,
+                expand=expand,
+                format=format,
+            )
+            pages = content.get("page", {}).get("results", [])
+            yield from pages
+            if len(pages) < batch_size:
+                return
+            start += len(pages)
+
     def get_page_by_title(
-        self, space_key: str, title: str, expand: Optional[str] = None
+        self,
+        space_key: str,
+        title: str,
+        expand: Optional[str] = None,
+        use_cache: bool = True,
     ) -> Optional[Dict[str, Any]]:
         """
         Get a Confluence page by its title within a specific space.
 
+        Pages that were found are kept in memory for PAGE_CACHE_TTL seconds,
+        so repeated lookups of the same page in a long-running process don't
+        fetch it again.
+
         Args:
             space_key: The key of the space containing the page
             title: The title of the page to retrieve
             expand: Optional comma-separated list of properties to expand
+            use_cache: Reuse a recently fetched copy of the page (default: True)
 
         Returns:
             Dictionary containing page details if found, None if not found
@@ -270,6 +609,13 @@ class ConfluenceClient(Platform):
         if not self.confluence:
             raise PlatformError("Not connected to Confluence")
 
+        key = (space_key, title, expand)
+        if use_cache:
+            page = self.page_cache.get(key)
+            if page is not None:
+                logger.debug(f"Using cached page '{title}' in space {space_key}")
+                return page
+
         try:
             logger.info(f"Getting page by title '{title}' in space: {space_key}")
             logger.debug(f"Using expand parameters: {expand}")
@@ -283,6 +629,7 @@ class ConfluenceClient(Platform):
             if page:
                 logger.info(f"Found page: {page.get('id')} - {page.get('title')}")
                 logger.debug(f"Page details: {page}")
+                self.page_cache.set(key, page)
                 return page
             else:
                 logger.info(f"No page found with title '{title}' in space {space_key}")
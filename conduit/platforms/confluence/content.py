@@ -1,5 +1,6 @@
 """Content processing utilities for Confluence."""
 
+import io
 import re
 from typing import Optional
 from bs4 import BeautifulSoup, NavigableString
@@ -8,6 +9,70 @@ import warnings
 # Suppress parser warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="bs4")
 
+# A table cell boundary together with the whitespace around it
+_CELL_BOUNDARY = re.compile(r"\s*\|\s*")
+
+# Cleanup applied to cleaned page text, as one alternation:
+#   - runs of blank lines collapse to a single blank line
+#   - runs of spaces collapse to one space
+#   - a heading directly after a line of text gets a blank line before it
+_POST_PROCESS = re.compile(r"\n\s*\n+| +|(?<=[^\n])\n(?=#)")
+
+
+def _post_process_match(match: re.Match) -> str:
+    """Replacement for a _POST_PROCESS match."""
+    return " " if match.group()[0] == " " else "\n\n"
+
+
+def format_markdown(text: str) -> str:
+    """Turn cleaned page text into markdown with proper tables and headings.
+
+    Rows containing "|" are normalized to "| a | b |", a "---------" line
+    becomes a markdown header separator sized to the row above it, bold
+    headings get blank lines around them and a table is followed by an
+    extra blank line.
+
+    Args:
+        text: Text produced by ConfluenceContentCleaner.clean
+
+    Returns:
+        The text formatted as markdown
+    """
+    buf = io.StringIO()
+    write = buf.write
+    previous = ""  # Last line written, used to size header separators
+    in_table = False
+
+    for line in text.split("\n"):
+        # Detect table header separator and size it from the previous row
+        if line.startswith("---------"):
+            in_table = True
+            previous = "|" + " --- |" * (previous.count("|") + 1)
+            write(previous)
+            write("\n")
+        # Add proper spacing around headings
+        elif line.startswith("**") and line.endswith("**"):
+            write(f"\n{line}\n\n")
+            previous = ""
+        # Normalize table rows in one regex substitution
+        elif "|" in line:
+            in_table = True
+            previous = "| " + _CELL_BOUNDARY.sub(" | ", line.strip()) + " |"
+            write(previous)
+            write("\n")
+        # Add extra line break after table
+        elif in_table and not line.strip():
+            in_table = False
+            write("\n\n")
+            previous = ""
+        else:
+            write(line)
+            write("\n")
+            previous = line
+
+    # Every line above is written with a trailing newline; drop the last one
+    return buf.getvalue()[:-1]
+
 
 class ConfluenceContentCleaner:
     """Clean and process Confluence storage format content."""
@@ -140,14 +205,5 @@ class ConfluenceContentCleaner:
         return text.strip()
 
     def _post_process(self, text: str) -> str:
-        """Post-process cleaned text."""
-        # Replace multiple newlines with double newline
-        text = re.sub(r"\n\s*\n+", "\n\n", text)
-
-        # Replace multiple spaces with single space
-        text = re.sub(r" +", " ", text)
-
-        # Ensure sections are well separated
-        text = re.sub(r"([^\n])\n#", r"\1\n\n#", text)
-
-        return text
+        """Post-process cleaned text in a single regex pass."""
+        return _POST_PROCESS.sub(_post_process_match, text)
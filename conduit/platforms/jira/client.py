@@ -1,4 +1,8 @@
-from atlassian import Jira
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from conduit.core.cache import TTLCache
+from conduit.platforms.session import create_session
 from conduit.platforms.base import Platform, IssueManager
 from conduit.core.config import load_config
 from conduit.core.exceptions import ConfigurationError, PlatformError
@@ -8,6 +12,16 @@ from typing import Any, Dict, Optional, List
 
 from conduit.core.logger import logger
 
+# Issues requested per search call; Jira Cloud may return fewer per page
+DEFAULT_BATCH_SIZE = 500
+
+# Seconds an issue, its transitions or its remote links are reused before
+# they are fetched again
+ISSUE_CACHE_TTL = 60
+
+# Issues sent per request to the bulk create endpoint, which accepts at most 50
+BULK_CREATE_SIZE = 50
+
 
 class JiraClient(Platform, IssueManager):
     def __init__(self, site_alias: Optional[str] = None):
@@ -15,92 +29,260 @@ class JiraClient(Platform, IssueManager):
             self.config = load_config().jira
             self.site_alias = site_alias
             self.jira = None
+            self.site_config = None
+            self.cache = TTLCache(maxsize=4096, ttl=ISSUE_CACHE_TTL)
             logger.info("Initialized Jira client")
         except (FileNotFoundError, ConfigurationError) as e:
-            logger.error(f"Failed to initialize Jira client: {e}")
+            logger.error("Failed to initialize Jira client: %s", e)
             raise
 
     def connect(self) -> None:
         logger.info("Connecting to Jira...")
         try:
             if not self.jira:
-                site_config = self.config.get_site_config(self.site_alias)
+                # Imported here so loading the module does not pull in the
+                # atlassian package until a client actually connects
+                from atlassian import Jira
+
+                self.site_config = self.config.get_site_config(self.site_alias)
                 self.jira = Jira(
-                    url=site_config.url,
-                    username=site_config.email,
-                    password=site_config.api_token,
+                    url=self.site_config.url,
+                    username=self.site_config.email,
+                    password=self.site_config.api_token,
                     cloud=True,
+                    session=create_session(),
                 )
                 logger.info("Connected to Jira successfully.")
         except Exception as e:
-            logger.error(f"Failed to connect to Jira: {e}")
+            logger.error("Failed to connect to Jira: %s", e)
             raise PlatformError(f"Failed to connect to Jira: {e}")
 
     def disconnect(self) -> None:
         self.jira = None
 
-    def get(self, key: str) -> Dict[str, Any]:
+    def clear_cache(self) -> None:
+        """Forget issues, transitions and remote links cached in memory."""
+        self.cache.clear()
+
+    def _invalidate(self, key: str) -> None:
+        """Drop the cached issue and transitions after the issue changes."""
+        self.cache.discard(("issue", key))
+        self.cache.discard(("transitions", key))
+
+    def get(self, key: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get an issue, reusing it for ISSUE_CACHE_TTL seconds.
+
+        Each call returns its own copy, so callers may modify the result
+        without affecting later reads.
+        """
         if not self.jira:
             raise PlatformError("Not connected to Jira")
+        if use_cache:
+            issue = self.cache.get(("issue", key))
+            if issue is not None:
+                return copy.deepcopy(issue)
         try:
             issue = self.jira.issue(key)
-            return issue.raw if hasattr(issue, "raw") else issue
+            issue = issue.raw if hasattr(issue, "raw") else issue
+            self.cache.set(("issue", key), issue)
+            return copy.deepcopy(issue)
         except Exception as e:
             raise PlatformError(f"Failed to get issue {key}: {e}")
 
-    def search(self, query: str) -> list[Dict[str, Any]]:
+    def search(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        start: int = 0,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = 8,
+    ) -> list[Dict[str, Any]]:
+        """
+        Search for issues using JQL.
+
+        The first page is fetched on its own to learn the search's total.
+        The remaining pages are then fetched concurrently, up to max_workers
+        at a time, and returned in order. If Jira caps the page size below
+        batch_size, the capped size is used for the remaining pages.
+
+        Args:
+            query: The JQL query
+            fields: Fields to return for each issue (default: all fields)
+            start: Index of the first issue to return (default: 0)
+            limit: Maximum number of issues to return (default: all matches)
+            batch_size: Number of issues to request per call (default: 500)
+            max_workers: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            List of matching issues
+
+        Raises:
+            PlatformError: If the search fails
+        """
         if not self.jira:
             raise PlatformError("Not connected to Jira")
         try:
-            result = self.jira.jql(query)
-            if not result or "issues" not in result:
-                return []
-            return result["issues"]
+            kwargs = {}
+            if fields:
+                kwargs["fields"] = ",".join(fields)
+
+            def fetch(offset: int, size: int) -> Dict[str, Any]:
+                result = self.jira.jql(query, start=offset, limit=size, **kwargs)
+                return result if result else {}
+
+            size = batch_size if limit is None else min(batch_size, limit)
+            result = fetch(start, size)
+            issues = result.get("issues", [])
+            end = result.get("total", start + len(issues))
+            if limit is not None:
+                end = min(end, start + limit)
+            offset = start + len(issues)
+            if not issues or offset >= end:
+                return issues
+
+            if len(issues) < size:
+                logger.warning(
+                    "Jira returned %s of %s requested issues; fetching %s per request",
+                    len(issues),
+                    size,
+                    len(issues),
+                )
+                batch_size = len(issues)
+
+            offsets = range(offset, end, batch_size)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages = executor.map(
+                    lambda o: fetch(o, min(batch_size, end - o)), offsets
+                )
+                for page in pages:
+                    issues.extend(page.get("issues", []))
+            return issues
         except Exception as e:
-            logger.error(f"Search error: {str(e)}")
+            logger.error("Search error: %s", e)
             raise PlatformError(
                 f"Failed to search issues with query '{query}': {str(e)}"
             )
 
+    @staticmethod
+    def _issue_fields(**kwargs) -> Dict[str, Any]:
+        """Build the fields of a new issue from create() keyword arguments."""
+        # Convert description from markdown to Jira format if present
+        description = kwargs.get("description", "")
+        if description:
+            description = markdown_to_jira(description)
+
+        return {
+            "project": {"key": kwargs["project"]["key"]},
+            "summary": kwargs["summary"],
+            "description": description,
+            "issuetype": {"name": kwargs.get("issuetype", {}).get("name", "Task")},
+        }
+
     def create(self, **kwargs) -> Dict[str, Any]:
         if not self.jira:
             raise PlatformError("Not connected to Jira")
         try:
-            # Convert description from markdown to Jira format if present
-            description = kwargs.get("description", "")
-            if description:
-                description = markdown_to_jira(description)
-
-            fields = {
-                "project": {"key": kwargs["project"]["key"]},
-                "summary": kwargs["summary"],
-                "description": description,
-                "issuetype": {"name": kwargs.get("issuetype", {}).get("name", "Task")},
-            }
-            logger.info(f"Creating issue with fields: {fields}")
-            site_config = self.config.get_site_config(self.site_alias)
-            logger.info(f"Jira API URL: {site_config.url}")
-            logger.info(f"API Token length: {len(site_config.api_token)}")
+            fields = self._issue_fields(**kwargs)
+            logger.info("Creating issue with fields: %s", fields)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Jira API URL: %s", self.site_config.url)
+                logger.debug("API Token length: %s", len(self.site_config.api_token))
 
             try:
                 logger.info("Making API call to create issue...")
                 result = self.jira.issue_create(fields=fields)
-                logger.info(f"API Response: {result}")
+                logger.info("API Response: %s", result)
             except Exception as api_error:
-                logger.error(f"API Error details: {str(api_error)}")
-                logger.error(f"API Error type: {type(api_error)}")
+                logger.error("API Error details: %s", api_error)
+                logger.error("API Error type: %s", type(api_error))
                 if hasattr(api_error, "response"):
-                    logger.error(f"Response status: {api_error.response.status_code}")
-                    logger.error(f"Response body: {api_error.response.text}")
+                    logger.error("Response status: %s", api_error.response.status_code)
+                    logger.error("Response body: %s", api_error.response.text)
                 raise
 
             if not result:
                 raise PlatformError("No response from Jira API")
             return result
         except Exception as e:
-            logger.error(f"Create error: {str(e)}")
+            logger.error("Create error: %s", e)
             raise PlatformError(f"Failed to create issue: {str(e)}")
 
+    def create_many(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several issues using Jira's bulk create endpoint.
+
+        Issues are sent in chunks of 50, one request per chunk.
+
+        Args:
+            issues: Keyword arguments for each issue, as passed to create()
+
+        Returns:
+            The created issues, in the order given
+
+        Raises:
+            PlatformError: If any chunk fails. Issues from earlier chunks
+                remain created and are listed in the error message.
+        """
+        if not self.jira:
+            raise PlatformError("Not connected to Jira")
+        created = []
+        try:
+            updates = iter([{"fields": self._issue_fields(**i)} for i in issues])
+            while chunk := list(islice(updates, BULK_CREATE_SIZE)):
+                logger.debug("Bulk creating %s issues", len(chunk))
+                result = self.jira.create_issues(chunk)
+                if not result or result.get("errors"):
+                    errors = result.get("errors") if result else "no response"
+                    raise PlatformError(f"Jira reported errors: {errors}")
+                created.extend(result["issues"])
+            return created
+        except Exception as e:
+            logger.error("Bulk create error: %s", e)
+            keys = ", ".join(issue["key"] for issue in created) or "none"
+            raise PlatformError(
+                f"Failed to create issues (created before failure: {keys}): {str(e)}"
+            )
+
+    def update_many(
+        self, updates: Dict[str, Dict[str, Any]], max_workers: int = 8
+    ) -> None:
+        """Update several issues concurrently.
+
+        Jira has no bulk edit endpoint for arbitrary fields, so each issue is
+        updated with its own request, up to max_workers at a time. Issues
+        whose fields are all None are skipped, as update() would skip them.
+
+        Args:
+            updates: Fields to update, keyed by issue key
+            max_workers: Maximum number of concurrent requests (default: 8)
+
+        Raises:
+            PlatformError: If any update fails, after all updates have been tried
+        """
+        if not self.jira:
+            raise PlatformError("Not connected to Jira")
+
+        # Issues with nothing to change never reach the thread pool
+        keys = [
+            key
+            for key, fields in updates.items()
+            if any(v is not None for v in fields.values())
+        ]
+        if not keys:
+            return
+
+        def update(key: str) -> Optional[Exception]:
+            try:
+                self.update(key, **updates[key])
+            except PlatformError as e:
+                return e
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = [e for e in executor.map(update, keys) if e is not None]
+        if errors:
+            raise PlatformError("; ".join(str(e) for e in errors))
+
     def update(self, key: str, **kwargs) -> None:
         if not self.jira:
             raise PlatformError("Not connected to Jira")
@@ -108,10 +290,11 @@ class JiraClient(Platform, IssueManager):
             fields = {k: v for k, v in kwargs.items() if v is not None}
             if not fields:
                 return
-            logger.debug(f"Updating issue {key} with fields: {fields}")
+            logger.debug("Updating issue %s with fields: %s", key, fields)
             self.jira.issue_update(key, fields)
+            self._invalidate(key)
         except Exception as e:
-            logger.error(f"Update error: {str(e)}")
+            logger.error("Update error: %s", e)
             raise PlatformError(f"Failed to update issue {key}: {str(e)}")
 
     def add_comment(self, key: str, comment: str) -> Dict[str, Any]:
@@ -130,25 +313,53 @@ class JiraClient(Platform, IssueManager):
         if not self.jira:
             raise PlatformError("Not connected to Jira")
         try:
-            logger.debug(f"Adding comment to issue {key}: {comment}")
+            logger.debug("Adding comment to issue %s: %s", key, comment)
             result = self.jira.issue_add_comment(key, comment)
+            self._invalidate(key)
             return result
         except Exception as e:
-            logger.error(f"Failed to add comment to issue {key}: {e}")
+            logger.error("Failed to add comment to issue %s: %s", key, e)
             raise PlatformError(f"Failed to add comment to issue {key}: {e}")
 
-    def get_transitions(self, key: str) -> List[Dict[str, Any]]:
+    def get_transitions(self, key: str, use_cache: bool = True) -> List[Dict[str, Any]]:
         """Get available transitions for an issue."""
         if not self.jira:
             raise PlatformError("Not connected to Jira")
+        if use_cache:
+            transitions = self.cache.get(("transitions", key))
+            if transitions is not None:
+                return transitions
         try:
             transitions = self.jira.get_issue_transitions(key)
-            logger.debug(f"Raw transitions response: {transitions}")
+            logger.debug("Raw transitions response: %s", transitions)
+            self.cache.set(("transitions", key), transitions)
             return transitions
         except Exception as e:
-            logger.error(f"Failed to get transitions for issue {key}: {e}")
+            logger.error("Failed to get transitions for issue %s: %s", key, e)
             raise PlatformError(f"Failed to get transitions for issue {key}: {e}")
 
+    @staticmethod
+    def _find_transition_id(
+        transitions: List[Dict[str, Any]], status: str
+    ) -> Optional[Any]:
+        """Find the transition leading to a status, matching names case-insensitively."""
+        status = status.lower()
+        for t in transitions:
+            # "to" is the target status; fall back to the transition's own name
+            if t.get("to", t["name"]).lower() == status:
+                return t["id"]
+        for t in transitions:
+            if t["name"].lower() == status:
+                return t["id"]
+        return None
+
+    def _set_transition(self, key: str, status: str, transition_id: Any) -> None:
+        """Post a transition by ID and forget the issue's cached state."""
+        logger.info("Setting issue %s status to '%s'", key, status)
+        self.jira.set_issue_status_by_transition_id(key, transition_id)
+        self._invalidate(key)
+        logger.info("Successfully set issue %s status to '%s'", key, status)
+
     def transition_status(self, key: str, status: str) -> None:
         """
         Transition an issue to a new status.
@@ -164,34 +375,56 @@ class JiraClient(Platform, IssueManager):
             raise PlatformError("Not connected to Jira")
 
         try:
-            # Get current status
-            current_status = self.jira.get_issue_status(key)
-            logger.info(f"Current status: {current_status}")
+            # Transitions fetched for this issue within the cache TTL, e.g. by
+            # get_transitions, save a request. If they have gone stale the
+            # post fails and is retried once with a fresh list.
+            transitions = self.cache.get(("transitions", key))
+            if transitions is not None:
+                transition_id = self._find_transition_id(transitions, status)
+                if transition_id is not None:
+                    try:
+                        self._set_transition(key, status, transition_id)
+                        return
+                    except Exception as e:
+                        logger.debug(
+                            "Cached transition for issue %s failed: %s", key, e
+                        )
 
-            # Get available transitions
             transitions = self.jira.get_issue_transitions(key)
-            logger.info("Available transitions:")
-            for t in transitions:
-                logger.info(f"ID: {t['id']}, Name: {t['name']}")
-
-            # Try to set the status directly
-            logger.info(f"Setting issue {key} status to '{status}'")
-            self.jira.set_issue_status(key, status)
-            logger.info(f"Successfully set issue {key} status to '{status}'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available transitions:")
+                for t in transitions:
+                    logger.debug("ID: %s, Name: %s", t["id"], t["name"])
+
+            # Resolve the transition here and post it by ID, rather than
+            # letting set_issue_status fetch the same transitions again
+            transition_id = self._find_transition_id(transitions, status)
+            if transition_id is None:
+                available = ", ".join(t.get("to", t["name"]) for t in transitions)
+                raise PlatformError(
+                    f"Cannot transition issue {key} to status '{status}'. "
+                    f"Available statuses: {available}"
+                )
+            self._set_transition(key, status, transition_id)
 
         except PlatformError:
             raise
         except Exception as e:
-            logger.error(f"Failed to transition issue {key} to status '{status}': {e}")
+            logger.error(
+                "Failed to transition issue %s to status '%s': %s", key, status, e
+            )
             raise PlatformError(
                 f"Failed to transition issue {key} to status '{status}': {e}"
             )
 
-    def get_remote_links(self, key: str) -> List[Dict[str, Any]]:
+    def get_remote_links(
+        self, key: str, use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
         """Get all remote links for a Jira issue.
 
         Args:
             key: The issue key (e.g., 'PROJ-123')
+            use_cache: Reuse links fetched within the last minute (default: True)
 
         Returns:
             List of remote link objects containing details like relationship, url, title etc.
@@ -201,8 +434,13 @@ class JiraClient(Platform, IssueManager):
         """
         if not self.jira:
             raise PlatformError("Not connected to Jira")
+        if use_cache:
+            remote_links = self.cache.get(("remote_links", key))
+            if remote_links is not None:
+                return remote_links
         try:
             remote_links = self.jira.get_issue_remote_links(key)
+            self.cache.set(("remote_links", key), remote_links)
             return remote_links
         except Exception as e:
             raise PlatformError(f"Failed to get remote links for issue {key}: {e}")
@@ -224,7 +462,7 @@ class JiraClient(Platform, IssueManager):
             raise PlatformError("Not connected to Jira")
         try:
             logger.debug(
-                f"Getting boards{f' for project {project_key}' if project_key else ''}"
+                "Getting boards%s", f" for project {project_key}" if project_key else ""
             )
             boards = self.jira.get_all_agile_boards(project_key=project_key)
             if not boards or "values" not in boards:
@@ -232,7 +470,7 @@ class JiraClient(Platform, IssueManager):
             return boards["values"]
         except Exception as e:
             error_msg = f"Failed to get boards{f' for project {project_key}' if project_key else ''}"
-            logger.error(f"{error_msg}: {e}")
+            logger.error("%s: %s", error_msg, e)
             raise PlatformError(f"{error_msg}: {e}")
 
     def get_sprints(
@@ -255,7 +493,9 @@ class JiraClient(Platform, IssueManager):
             raise PlatformError("Not connected to Jira")
         try:
             logger.debug(
-                f"Getting sprints for board {board_id}{f' with state {state}' if state else ''}"
+                "Getting sprints for board %s%s",
+                board_id,
+                f" with state {state}" if state else "",
             )
             sprints = self.jira.get_all_sprints_from_board(board_id, state=state)
             if not sprints or "values" not in sprints:
@@ -263,7 +503,7 @@ class JiraClient(Platform, IssueManager):
             return sprints["values"]
         except Exception as e:
             error_msg = f"Failed to get sprints for board {board_id}{f' with state {state}' if state else ''}"
-            logger.error(f"{error_msg}: {e}")
+            logger.error("%s: %s", error_msg, e)
             raise PlatformError(f"{error_msg}: {e}")
 
     def add_issues_to_sprint(self, sprint_id: int, issue_keys: List[str]) -> None:
@@ -280,7 +520,7 @@ class JiraClient(Platform, IssueManager):
         if not self.jira:
             raise PlatformError("Not connected to Jira")
         try:
-            logger.debug(f"Adding issues {issue_keys} to sprint {sprint_id}")
+            logger.debug("Adding issues %s to sprint %s", issue_keys, sprint_id)
 
             # Verify all issues exist before attempting to add them
             for key in issue_keys:
@@ -293,10 +533,14 @@ class JiraClient(Platform, IssueManager):
 
             # Add issues to sprint
             self.jira.add_issues_to_sprint(sprint_id, issue_keys)
-            logger.info(f"Successfully added issues {issue_keys} to sprint {sprint_id}")
+            for key in issue_keys:
+                self._invalidate(key)
+            logger.info(
+                "Successfully added issues %s to sprint %s", issue_keys, sprint_id
+            )
         except PlatformError:
             raise
         except Exception as e:
             error_msg = f"Failed to add issues {issue_keys} to sprint {sprint_id}"
-            logger.error(f"{error_msg}: {e}")
+            logger.error("%s: %s", error_msg, e)
             raise PlatformError(f"{error_msg}: {e}")
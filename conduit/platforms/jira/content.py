@@ -1,6 +1,11 @@
 """Content conversion utilities for Jira."""
 
+from functools import lru_cache
 
+
+# Bulk creates often reuse the same description template, so conversions are
+# memoized; the result depends only on the input string
+@lru_cache(maxsize=256)
 def markdown_to_jira(content: str) -> str:
     """Convert markdown content to Jira markup format.
 
@@ -0,0 +1,62 @@
+"""Shared HTTP session setup for the Atlassian platform clients."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Large enough for the concurrent page and issue fetches to keep every
+# connection alive instead of discarding the overflow after each request.
+POOL_MAXSIZE = 32
+
+# Rate limiting and transient server errors worth retrying. Only idempotent
+# methods are retried, so a failed POST never creates an issue twice.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _decode_with_orjson(response: requests.Response, *args, **kwargs):
+    """Make a response's json() parse the body with orjson.
+
+    Atlassian returns UTF-8 JSON, which orjson parses directly from the raw
+    bytes. Its decode errors are ValueErrors, as the clients expect.
+    """
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def create_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """Create a requests session with a keep-alive connection pool.
+
+    The atlassian-python-api clients accept this session in place of the
+    default one, so TLS connections are reused across every call a client
+    makes, including calls issued from several threads at once. Idempotent
+    requests that hit a rate limit or a transient server error are retried
+    with backoff, honouring any Retry-After header. When orjson is installed
+    it parses the JSON responses.
+
+    Args:
+        pool_maxsize: Maximum number of connections kept open per host
+
+    Returns:
+        A configured requests session
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUSES,
+        # Hand the last response back so the client reports the API's error
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retries
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if orjson is not None:
+        session.hooks["response"].append(_decode_with_orjson)
+    return session
@@ -35,7 +35,7 @@ try:
     pages = confluence.get_pages_by_space("ACT", limit=10)
 
     # Get all pages with pagination
-    all_pages = confluence.get_all_pages_by_space("ACT", batch_size=100)
+    all_pages = confluence.get_all_pages_by_space("ACT")
 
     # Get the first page ID from all_pages (if any pages exist)
     if all_pages and len(all_pages) > 0:
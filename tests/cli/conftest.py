@@ -0,0 +1,11 @@
+import pytest
+
+from conduit.cli import daemon
+
+
+@pytest.fixture(autouse=True)
+def clear_connected_clients():
+    """Drop clients cached by earlier tests so each test gets its own mocks."""
+    daemon._connected_for_config.cache_clear()
+    yield
+    daemon._connected_for_config.cache_clear()
@@ -0,0 +1,149 @@
+"""Tests for Confluence CLI commands."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from conduit.cli.main import cli
+from conduit.core.exceptions import PlatformError
+
+PAGES = [
+    {"id": "1", "title": "Home", "body": {"storage": {"value": "<p>Hi</p>"}}},
+    {"id": "2", "title": "Notes", "body": {"storage": {"value": "<p>Notes</p>"}}},
+]
+
+
+class MockConfluence:
+    def connect(self):
+        pass
+
+    def iter_space_content(self, space, depth, expand, format, use_cache):
+        for page in PAGES:
+            if not expand:
+                yield {"id": page["id"], "title": page["title"]}
+            elif format == "clean":
+                yield {**page, "body": {**page["body"], "clean": page["title"]}}
+            else:
+                yield page
+
+    def iter_all_pages_by_space(self, space, batch_size, use_cache):
+        yield from ({"id": page["id"], "title": page["title"]} for page in PAGES)
+
+    def get_child_pages_bulk(self, parent_ids):
+        return {pid: [PAGES[0]] if pid == "10" else [] for pid in parent_ids}
+
+
+@pytest.fixture
+def cli_runner(monkeypatch):
+    monkeypatch.setenv("CONDUIT_NO_DAEMON", "1")
+    monkeypatch.setattr(
+        "conduit.platforms.registry.PlatformRegistry.get_platform",
+        lambda name, site_alias=None: MockConfluence(),
+    )
+    return CliRunner()
+
+
+def test_pages_content_storage(cli_runner):
+    """Test that each page is printed with its header and storage body."""
+    result = cli_runner.invoke(
+        cli, ["confluence", "pages", "content", "SPACE", "--format", "storage"]
+    )
+
+    assert result.exit_code == 0
+    assert "=== Home (ID: 1) ===\n<p>Hi</p>\n" in result.output
+    assert "=== Notes (ID: 2) ===\n<p>Notes</p>\n" in result.output
+    assert "Found 2 pages in space SPACE" in result.output
+
+
+def test_pages_content_raw_prints_json(cli_runner):
+    """Test that the raw format prints each page as JSON."""
+    result = cli_runner.invoke(
+        cli, ["confluence", "pages", "content", "SPACE", "--format", "raw"]
+    )
+
+    assert result.exit_code == 0
+    first = result.output.split("=== Home (ID: 1) ===\n")[1].split("\n\n===")[0]
+    assert json.loads(first) == PAGES[0]
+
+
+def test_pages_content_metadata_only(cli_runner):
+    """Test listing pages without bodies."""
+    result = cli_runner.invoke(
+        cli, ["confluence", "pages", "content", "SPACE", "--expand", ""]
+    )
+
+    assert result.exit_code == 0
+    assert "=== Home (ID: 1) ===\n\n=== Notes (ID: 2) ===" in result.output
+    assert "Found 2 pages" in result.output
+
+
+def test_pages_list_all_ndjson(cli_runner):
+    """Test that ndjson output prints one compact record per line."""
+    result = cli_runner.invoke(
+        cli, ["confluence", "pages", "list-all", "SPACE", "--output", "ndjson"]
+    )
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {"id": "1", "title": "Home"},
+        {"id": "2", "title": "Notes"},
+    ]
+
+
+def test_pages_list_all_tsv(cli_runner):
+    """Test that tsv output prints only id and title columns."""
+    result = cli_runner.invoke(
+        cli, ["confluence", "pages", "list-all", "SPACE", "--output", "tsv"]
+    )
+
+    assert result.exit_code == 0
+    assert result.output == "1\tHome\n2\tNotes\n"
+
+
+def test_pages_content_clean(cli_runner):
+    """Test that the clean format prints the cleaned body."""
+    result = cli_runner.invoke(cli, ["confluence", "pages", "content", "SPACE"])
+
+    assert result.exit_code == 0
+    assert "=== Home (ID: 1) ===\nHome\n" in result.output
+
+
+def test_pages_content_rejects_unknown_format(cli_runner):
+    """Test that an unknown format is a usage error."""
+    result = cli_runner.invoke(
+        cli, ["confluence", "pages", "content", "SPACE", "--format", "html"]
+    )
+
+    assert result.exit_code == 2
+    assert "Invalid value for '--format'" in result.output
+
+
+def test_pages_children_of_several_parents(cli_runner):
+    """Test that children of several parents are listed per parent."""
+    result = cli_runner.invoke(cli, ["confluence", "pages", "children", "10", "20"])
+
+    assert result.exit_code == 0
+    assert "Child pages of 10:\n- Home (ID: 1)" in result.output
+    assert "No child pages found for parent 20" in result.output
+
+
+def test_pages_list_all_failure_exits_nonzero(cli_runner, monkeypatch):
+    """Test that a failed listing is reported with exit status 1."""
+
+    def fail(self, space, batch_size, use_cache):
+        raise PlatformError("Space not found")
+
+    monkeypatch.setattr(MockConfluence, "iter_all_pages_by_space", fail)
+    result = cli_runner.invoke(cli, ["confluence", "pages", "list-all", "SPACE"])
+
+    assert result.exit_code == 1
+    assert "Error: Space not found" in result.output
+
+
+def test_pages_children_of_one_parent(cli_runner):
+    """Test that a single parent uses the same combined search."""
+    result = cli_runner.invoke(cli, ["confluence", "pages", "children", "10"])
+
+    assert result.exit_code == 0
+    assert "Child pages of 10:\n- Home (ID: 1)" in result.output
@@ -23,13 +23,15 @@ def mock_config(tmp_path, monkeypatch):
     def mock_load_config():
         return config
 
-    monkeypatch.setattr("conduit.cli.main.load_config", mock_load_config)
+    monkeypatch.setattr("conduit.core.config.load_config", mock_load_config)
+    monkeypatch.setattr("conduit.cli.commands.jira.load_config", mock_load_config)
+    monkeypatch.setenv("CONDUIT_NO_DAEMON", "1")
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Create a Click CLI test runner."""
+    """Create a Click CLI test runner shared by the tests; it keeps no state."""
     return CliRunner()
 
 
@@ -154,7 +156,7 @@ def test_update_issue_with_content_file(cli_runner, mock_config, monkeypatch):
         return MockPlatform()
 
     monkeypatch.setattr(
-        "conduit.cli.commands.jira.PlatformRegistry.get_platform", mock_get_platform
+        "conduit.platforms.registry.PlatformRegistry.get_platform", mock_get_platform
     )
 
     result = cli_runner.invoke(
@@ -202,7 +204,7 @@ def test_add_comment_with_content_file(cli_runner, mock_config, monkeypatch):
         return MockPlatform()
 
     monkeypatch.setattr(
-        "conduit.cli.commands.jira.PlatformRegistry.get_platform", mock_get_platform
+        "conduit.platforms.registry.PlatformRegistry.get_platform", mock_get_platform
     )
 
     result = cli_runner.invoke(
@@ -219,3 +221,66 @@ def test_add_comment_with_content_file(cli_runner, mock_config, monkeypatch):
 
     assert result.exit_code == 0
     assert "Successfully added comment to issue TEST-1" in result.output
+
+
+def test_add_comment_platform_error_marks_content_failed(
+    cli_runner, mock_config, monkeypatch
+):
+    """Test that a platform error is reported and the content file kept."""
+    from conduit.core.exceptions import PlatformError
+
+    content_file = mock_config.content_dir / "comment.md"
+    mock_config.content_dir.mkdir(exist_ok=True)
+    content_file.write_text("Test comment")
+
+    class MockPlatform:
+        def connect(self):
+            pass
+
+        def add_comment(self, key, comment):
+            raise PlatformError("Issue does not exist")
+
+    monkeypatch.setattr(
+        "conduit.platforms.registry.PlatformRegistry.get_platform",
+        lambda name, site_alias=None: MockPlatform(),
+    )
+
+    result = cli_runner.invoke(
+        cli,
+        ["jira", "issue", "comment", "TEST-1", "--content-file", str(content_file)],
+    )
+
+    assert result.exit_code == 1
+    assert "Error: Issue does not exist" in result.output
+    assert "Content file moved to:" in result.output
+    assert not content_file.exists()
+
+
+def test_remote_links_output(cli_runner, mock_config, monkeypatch):
+    """Test remote links are printed one block per link."""
+
+    class MockPlatform:
+        def connect(self):
+            pass
+
+        def get_remote_links(self, key):
+            return [
+                {
+                    "relationship": "mentioned in",
+                    "object": {"title": "Design doc", "url": "https://example.com"},
+                },
+                {"object": None},
+            ]
+
+    monkeypatch.setattr(
+        "conduit.platforms.registry.PlatformRegistry.get_platform",
+        lambda name, site_alias=None: MockPlatform(),
+    )
+
+    result = cli_runner.invoke(cli, ["jira", "issue", "remote-links", "TEST-1"])
+
+    assert result.exit_code == 0
+    assert result.output == (
+        "\nDesign doc\nRelationship: mentioned in\nURL: https://example.com\n"
+        "\nNo title\nRelationship: relates to\nURL: No URL\n"
+    )
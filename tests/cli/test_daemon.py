@@ -0,0 +1,213 @@
+"""Tests for the CLI daemon."""
+
+import socket
+import threading
+
+import pytest
+
+from conduit.cli import daemon
+from conduit.core.exceptions import PlatformError
+
+
+class MockPlatform:
+    instances = 0
+
+    def __init__(self):
+        MockPlatform.instances += 1
+
+    def connect(self):
+        pass
+
+    def get(self, key):
+        return {"key": key}
+
+    def search(self, query):
+        raise PlatformError(f"Bad query: {query}")
+
+    def iter_pages(self, count):
+        for i in range(count):
+            yield {"id": str(i)}
+
+
+@pytest.fixture
+def mock_platform(monkeypatch):
+    """Replace platform lookup with a counting mock."""
+    MockPlatform.instances = 0
+
+    def mock_get_platform(name, site_alias=None):
+        return MockPlatform()
+
+    monkeypatch.setattr(
+        "conduit.platforms.registry.PlatformRegistry.get_platform", mock_get_platform
+    )
+
+
+@pytest.fixture
+def running_daemon(tmp_path, mock_platform):
+    """Run a daemon server on a temporary socket."""
+    socket_path = tmp_path / "conduit.sock"
+    server = daemon.DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+
+
+def test_daemon_reuses_connected_client(running_daemon):
+    """Test that repeated calls share one connected client."""
+    first = daemon.request("jira", None, "get", "TEST-1", socket_path=running_daemon)
+    second = daemon.request("jira", None, "get", "TEST-2", socket_path=running_daemon)
+
+    assert first == {"key": "TEST-1"}
+    assert second == {"key": "TEST-2"}
+    assert MockPlatform.instances == 1
+    assert daemon.ping(running_daemon) == 1
+
+
+def test_daemon_streams_generator_results(running_daemon):
+    """Test that generator results are streamed item by item."""
+    pages = daemon.request("jira", None, "iter_pages", 3, socket_path=running_daemon)
+
+    assert not isinstance(pages, list)
+    assert list(pages) == [{"id": "0"}, {"id": "1"}, {"id": "2"}]
+
+
+def test_daemon_reports_errors(running_daemon):
+    """Test that client errors are raised on the calling side."""
+    with pytest.raises(PlatformError, match="Bad query: project=TEST"):
+        daemon.request(
+            "jira", None, "search", "project=TEST", socket_path=running_daemon
+        )
+
+
+def test_daemon_rejects_private_methods(running_daemon):
+    """Test that only public client methods can be invoked."""
+    with pytest.raises(PlatformError, match="cannot be invoked"):
+        daemon.request("jira", None, "connect", socket_path=running_daemon)
+
+
+def test_invoke_runs_in_process_without_daemon(tmp_path, monkeypatch, mock_platform):
+    """Test that invoke falls back to an in-process client."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.delenv("CONDUIT_DAEMON", raising=False)
+
+    assert daemon.invoke("jira", None, "get", "TEST-1") == {"key": "TEST-1"}
+    assert MockPlatform.instances == 1
+
+
+def test_invoke_many_shares_one_client(tmp_path, monkeypatch, mock_platform):
+    """Test that concurrent calls share a client and keep their order."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.delenv("CONDUIT_DAEMON", raising=False)
+
+    results = daemon.invoke_many(
+        "jira", None, "get", [("TEST-1",), ("TEST-2",), ("TEST-3",)]
+    )
+
+    assert results == [{"key": "TEST-1"}, {"key": "TEST-2"}, {"key": "TEST-3"}]
+    assert MockPlatform.instances == 1
+
+
+def test_invoke_many_returns_failures_in_place(tmp_path, monkeypatch, mock_platform):
+    """Test that a failing call does not hide the other results."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    results = daemon.invoke_many("jira", None, "search", [("a",), ("b",)])
+
+    assert all(isinstance(result, PlatformError) for result in results)
+    assert "Bad query: b" in str(results[1])
+
+
+def test_invoke_connects_once_per_site(tmp_path, monkeypatch, mock_platform):
+    """Test that repeated calls in one process reuse the connected client."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.delenv("CONDUIT_DAEMON", raising=False)
+
+    daemon.invoke("jira", None, "get", "TEST-1")
+    daemon.invoke("jira", None, "get", "TEST-2")
+    assert MockPlatform.instances == 1
+
+    daemon.invoke("jira", "other", "get", "TEST-3")
+    assert MockPlatform.instances == 2
+
+
+def test_daemon_socket_is_private(running_daemon):
+    """Test that the socket is created readable only by its owner."""
+    assert running_daemon.stat().st_mode & 0o777 == 0o600
+
+
+def test_invoke_ignores_untrusted_socket(tmp_path, monkeypatch, mock_platform):
+    """Test that a path which is not a socket is never forwarded to."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    socket_path = daemon.get_socket_path()
+    socket_path.parent.mkdir()
+    socket_path.write_text("not a socket")
+
+    assert daemon.invoke("jira", None, "get", "TEST-1") == {"key": "TEST-1"}
+    with pytest.raises(PlatformError, match="untrusted daemon socket"):
+        daemon.ping(socket_path)
+
+
+def test_insecure_socket_directory_is_rejected(tmp_path):
+    """Test that a socket directory open to other users is refused."""
+    socket_dir = tmp_path / "conduit"
+    socket_dir.mkdir(mode=0o777)
+    socket_dir.chmod(0o777)
+
+    with pytest.raises(PlatformError, match="insecure daemon directory"):
+        daemon._ensure_private_dir(socket_dir)
+
+
+def test_invoke_reconnects_after_config_change(tmp_path, monkeypatch, mock_platform):
+    """Test that editing the config file replaces cached clients."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    versions = iter([(1, 10), (1, 10), (2, 12)])
+    monkeypatch.setattr(daemon, "_config_version", lambda: next(versions))
+
+    daemon.invoke("jira", None, "get", "TEST-1")
+    daemon.invoke("jira", None, "get", "TEST-2")
+    assert MockPlatform.instances == 1
+
+    daemon.invoke("jira", None, "get", "TEST-3")
+    assert MockPlatform.instances == 2
+
+
+def test_invoke_keeps_socket_of_live_daemon(running_daemon, monkeypatch):
+    """Test that a refused call does not remove a daemon that still answers."""
+    monkeypatch.setattr(daemon, "get_socket_path", lambda: running_daemon)
+    monkeypatch.setattr(daemon, "STALE_SOCKET_RETRY_DELAY", 0)
+
+    def refuse(*args, **kwargs):
+        raise ConnectionRefusedError
+
+    monkeypatch.setattr(daemon, "request", refuse)
+
+    assert daemon.invoke("jira", None, "get", "TEST-1") == {"key": "TEST-1"}
+    assert running_daemon.exists()
+
+
+def test_invoke_removes_stale_socket(tmp_path, monkeypatch, mock_platform):
+    """Test that a socket nobody listens on is removed after a failed ping."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setattr(daemon, "STALE_SOCKET_RETRY_DELAY", 0)
+    socket_path = daemon.get_socket_path()
+    socket_path.parent.mkdir(mode=0o700)
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    try:
+        assert daemon.invoke("jira", None, "get", "TEST-1") == {"key": "TEST-1"}
+    finally:
+        stale.close()
+
+    assert not socket_path.exists()
+
+
+def test_spawn_waits_until_daemon_answers(tmp_path):
+    """Test that spawn returns only once the daemon accepts requests."""
+    socket_path = tmp_path / "conduit.sock"
+    daemon.spawn(socket_path)
+    try:
+        assert daemon.ping(socket_path) == 0
+    finally:
+        daemon.shutdown(socket_path)
@@ -0,0 +1,52 @@
+"""Tests for Jira CLI commands."""
+
+import pytest
+from click.testing import CliRunner
+
+from conduit.cli.main import cli
+
+
+class MockJira:
+    searches = []
+
+    def connect(self):
+        pass
+
+    def search(self, query, fields, start, limit):
+        MockJira.searches.append({"query": query, "fields": fields, "limit": limit})
+        return [{"key": "TEST-1", "fields": {"summary": "First"}}]
+
+
+@pytest.fixture
+def cli_runner(monkeypatch):
+    monkeypatch.setenv("CONDUIT_NO_DAEMON", "1")
+    MockJira.searches = []
+    monkeypatch.setattr(
+        "conduit.platforms.registry.PlatformRegistry.get_platform",
+        lambda name, site_alias=None: MockJira(),
+    )
+    return CliRunner()
+
+
+def test_issue_search_is_bounded_by_default(cli_runner):
+    """Test that a search returns at most 50 issues unless told otherwise."""
+    result = cli_runner.invoke(cli, ["jira", "issue", "search", "project = TEST"])
+
+    assert result.exit_code == 0
+    assert MockJira.searches == [
+        {
+            "query": "project = TEST",
+            "fields": ["key", "summary", "status"],
+            "limit": 50,
+        }
+    ]
+
+
+def test_issue_search_all_removes_limit(cli_runner):
+    """Test that --all fetches every matching issue."""
+    result = cli_runner.invoke(
+        cli, ["jira", "issue", "search", "project = TEST", "--all"]
+    )
+
+    assert result.exit_code == 0
+    assert MockJira.searches[0]["limit"] is None
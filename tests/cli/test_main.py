@@ -0,0 +1,57 @@
+"""Tests for the top-level CLI."""
+
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from conduit.cli.main import cli
+
+
+def test_help_lists_lazy_command_groups():
+    """Test that lazily loaded groups still appear in help output."""
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ("jira", "confluence", "daemon", "config"):
+        assert name in result.output
+
+
+def test_heavy_modules_are_imported_on_demand():
+    """Test that importing the CLI does not import command, config or platform modules."""
+    modules = [
+        "conduit.cli.commands.jira",
+        "conduit.cli.commands.confluence",
+        "conduit.core.config",
+        "conduit.platforms.registry",
+    ]
+    code = (
+        f"import sys, conduit.cli.main; print(*[m in sys.modules for m in {modules}])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["False"] * len(modules)
+
+
+def test_config_clean_deletes_file_once(tmp_path, monkeypatch):
+    """Test that config clean removes the file and tolerates a missing one."""
+    monkeypatch.setattr("conduit.core.config.get_config_dir", lambda: tmp_path)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("jira: {}\n")
+
+    runner = CliRunner()
+    assert runner.invoke(cli, ["config", "clean"]).exit_code == 0
+    assert not config_path.exists()
+    assert runner.invoke(cli, ["config", "clean"]).exit_code == 0
+
+
+def test_mcp_package_imports_server_on_demand():
+    """Test that importing conduit.mcp does not build the MCP server."""
+    code = "import sys, conduit.mcp; print('conduit.mcp.server' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,46 @@
+"""Tests for CLI output helpers."""
+
+import json
+
+from conduit.cli import output
+
+
+def test_emit_prints_json_for_api_responses(capsys):
+    """Test that dict responses are printed as parseable JSON."""
+    output.emit({"key": "TEST-1", "fields": {"summary": "Café"}})
+
+    assert json.loads(capsys.readouterr().out) == {
+        "key": "TEST-1",
+        "fields": {"summary": "Café"},
+    }
+
+
+def test_emit_prints_other_values_unchanged(capsys):
+    """Test that strings and scalars are printed as-is."""
+    output.emit("plain text")
+
+    assert capsys.readouterr().out == "plain text\n"
+
+
+def test_emit_records_json_array(capsys):
+    """Test that json output prints all records as one array."""
+    count = output.emit_records(iter([{"id": 1}, {"id": 2}]), "json", None)
+
+    assert count == 2
+    assert json.loads(capsys.readouterr().out) == [{"id": 1}, {"id": 2}]
+
+
+def test_emit_records_ndjson_in_batches(capsys):
+    """Test that ndjson rows are all written when spread over batches."""
+    records = [{"id": i} for i in range(5)]
+
+    count = output.emit_records(records, "ndjson", None, batch_size=2)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert count == 5
+    assert [json.loads(line) for line in lines] == records
+
+
+def test_to_tsv_row_flattens_whitespace():
+    """Test that tabs and newlines in values cannot break tsv rows."""
+    assert output.to_tsv_row(["1", "Two\tparts\nhere", None]) == "1\tTwo parts here\t"
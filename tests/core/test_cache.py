@@ -0,0 +1,93 @@
+"""Tests for the on-disk response cache."""
+
+import os
+
+import pytest
+from conduit.core.cache import ResponseCache, TTLCache, get_cache_dir
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a ResponseCache in a temporary directory."""
+    return ResponseCache(tmp_path / "cache")
+
+
+def test_cache_round_trip(cache):
+    """Test that a stored value is returned for the same validator."""
+    cache.set(("pages", "SPACE"), [3, "42"], [{"id": "1"}])
+    assert cache.get(("pages", "SPACE"), [3, "42"]) == [{"id": "1"}]
+
+
+def test_cache_rejects_stale_validator(cache):
+    """Test that an entry stored with another validator is a miss."""
+    cache.set(("pages", "SPACE"), [3, "42"], [{"id": "1"}])
+    assert cache.get(("pages", "SPACE"), [4, "43"]) is None
+
+
+def test_cache_miss(cache):
+    """Test that an unknown key is a miss."""
+    assert cache.get(("pages", "OTHER"), [0]) is None
+
+
+def test_cache_ignores_unserializable_values(cache):
+    """Test that a failed write leaves no entry behind."""
+    cache.set(("pages", "SPACE"), [1], object())
+    assert cache.get(("pages", "SPACE"), [1]) is None
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_cache_evicts_oldest_entries(tmp_path):
+    """Test that writing past max_entries removes the oldest files."""
+    cache = ResponseCache(tmp_path / "cache", max_entries=2)
+    for i in range(3):
+        cache.set(("key", i), "v1", i)
+        os.utime(cache._path(("key", i)), ns=(i * 10**9, i * 10**9))
+    cache.set(("key", 3), "v1", 3)
+
+    assert cache.get(("key", 0), "v1") is None
+    assert cache.get(("key", 1), "v1") is None
+    assert cache.get(("key", 2), "v1") == 2
+    assert cache.get(("key", 3), "v1") == 3
+
+
+def test_cache_dir_respects_xdg_cache_home(tmp_path, monkeypatch):
+    """Test that XDG_CACHE_HOME overrides the default location."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_cache_dir() == tmp_path / "conduit"
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    """Test that entries are served until their time to live has passed."""
+    now = [100.0]
+    monkeypatch.setattr("conduit.core.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10)
+    cache.set("page", {"id": "1"})
+
+    now[0] += 9
+    assert cache.get("page") == {"id": "1"}
+    now[0] += 1
+    assert cache.get("page") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that a full cache drops the entry used longest ago."""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_ttl_cache_discards_single_entry():
+    """Test that discarding one key leaves the others cached."""
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.discard("a")
+    cache.discard("missing")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
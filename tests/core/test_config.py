@@ -0,0 +1,96 @@
+"""Tests for configuration loading."""
+
+import pytest
+from conduit.core import config as config_module
+from conduit.core.config import (
+    JiraConfig,
+    clear_config_cache,
+    create_default_config,
+    load_config,
+)
+from conduit.core.exceptions import ConfigurationError
+
+CONFIG_YAML = """
+jira:
+  default-site-alias: default
+  sites:
+    default:
+      url: https://example.atlassian.net
+      email: test@example.com
+      api_token: token
+confluence:
+  sites:
+    default:
+      url: https://example.atlassian.net/wiki
+      email: test@example.com
+      api_token: token
+"""
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Point configuration loading at a temporary directory."""
+    monkeypatch.setattr(config_module, "get_config_dir", lambda: tmp_path)
+    clear_config_cache()
+    yield tmp_path
+    clear_config_cache()
+
+
+def test_load_config(config_dir):
+    """Test loading a valid configuration file."""
+    (config_dir / "config.yaml").write_text(CONFIG_YAML)
+
+    config = load_config()
+
+    assert config.jira.get_site_config().url == "https://example.atlassian.net"
+    assert config.confluence.get_site_config().email == "test@example.com"
+
+
+def test_load_config_invalid_yaml(config_dir):
+    """Test that malformed YAML is reported as a configuration error."""
+    (config_dir / "config.yaml").write_text("jira: [unclosed")
+
+    with pytest.raises(ConfigurationError, match="Invalid YAML"):
+        load_config()
+
+
+def test_load_config_missing_file(config_dir):
+    """Test that a missing file points the user at --init."""
+    with pytest.raises(ConfigurationError, match="conduit --init"):
+        load_config()
+
+
+def test_load_config_reuses_parsed_config(config_dir):
+    """Test that an unchanged file is not parsed again."""
+    (config_dir / "config.yaml").write_text(CONFIG_YAML)
+
+    assert load_config() is load_config()
+
+
+def test_load_config_reloads_changed_file(config_dir):
+    """Test that editing the file invalidates the cached config."""
+    config_file = config_dir / "config.yaml"
+    config_file.write_text(CONFIG_YAML)
+    first = load_config()
+
+    config_file.write_text(CONFIG_YAML.replace("test@", "changed@"))
+
+    assert load_config() is not first
+    assert load_config().jira.get_site_config().email == "changed@example.com"
+
+
+def test_platform_config_accepts_yaml_keys_and_field_names():
+    """Test that the kebab-case YAML key and the field name both set the alias."""
+    sites = {"other": {"url": "u", "email": "e", "api_token": "t"}}
+
+    from_yaml = JiraConfig(**{"default-site-alias": "other", "sites": sites})
+    from_field = JiraConfig(default_site_alias="other", sites=sites)
+
+    assert from_yaml.default_site_alias == from_field.default_site_alias == "other"
+
+
+def test_create_default_config_writes_packaged_template(config_dir):
+    """Test that the packaged default config is written and loads."""
+    create_default_config(config_dir / "config.yaml")
+
+    assert load_config().jira.default_site_alias == "default"
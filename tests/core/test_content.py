@@ -171,3 +171,11 @@ def test_failed_content_directory_creation(tmp_path):
     failed_dir = content_dir / "failed_content"
     assert failed_dir.exists()
     assert failed_dir.is_dir()
+
+
+def test_is_content_file_rejects_siblings_and_traversal(content_manager, tmp_path):
+    """Test that only paths inside the content directory are accepted."""
+    content_dir = content_manager.content_dir
+    assert content_manager.is_content_file(content_dir / "note.md")
+    assert not content_manager.is_content_file(tmp_path / "content2" / "note.md")
+    assert not content_manager.is_content_file(content_dir / ".." / "outside.md")
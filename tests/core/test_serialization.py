@@ -0,0 +1,22 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+from datetime import datetime
+
+from conduit.core import serialization
+
+
+def test_to_json_falls_back_to_stdlib(monkeypatch):
+    """Test serialization without orjson installed."""
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    result = serialization.to_json({"when": datetime(2024, 1, 2)})
+
+    assert json.loads(result) == {"when": "2024-01-02 00:00:00"}
+
+
+def test_to_json_line_is_compact():
+    """Test that records are written on a single line without spaces."""
+    assert serialization.to_json_line({"key": "TEST-1", "n": [1, 2]}) == (
+        '{"key":"TEST-1","n":[1,2]}'
+    )
@@ -0,0 +1,275 @@
+import threading
+
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from conduit.platforms.confluence.client import ConfluenceClient
+from conduit.core.exceptions import PlatformError
+
+
+def make_pages(start, count):
+    return [{"id": str(i), "title": f"Page {i}"} for i in range(start, start + count)]
+
+
+def paged_space(total, server_limit=None):
+    """Build a get_all_pages_from_space side effect for a space of `total` pages."""
+
+    def get_all_pages_from_space(space, start, limit, **kwargs):
+        limit = min(limit, server_limit or limit)
+        return make_pages(start, max(0, min(limit, total - start)))
+
+    return get_all_pages_from_space
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+
+@pytest.fixture
+def mock_config():
+    with patch("conduit.platforms.confluence.client.load_config") as mock:
+        site_config = MagicMock()
+        site_config.url = "https://example.atlassian.net"
+        site_config.email = "test@example.com"
+        site_config.api_token = "dummy_token"
+        mock.return_value.confluence.get_site_config.return_value = site_config
+        yield mock
+
+
+@pytest.fixture
+def mock_confluence():
+    with patch("conduit.platforms.confluence.client.Confluence") as mock:
+        mock.return_value.cql.return_value = {
+            "totalSize": 30,
+            "results": [{"content": {"id": "7"}, "lastModified": "2024-05-01"}],
+        }
+        yield mock.return_value
+
+
+@pytest.fixture
+def confluence_client(mock_config, mock_confluence):
+    client = ConfluenceClient()
+    client.connect()
+    return client
+
+
+def test_get_all_pages_single_batch(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(30)
+    pages = confluence_client.get_all_pages_by_space("TEST", batch_size=100)
+    assert len(pages) == 30
+    confluence_client.confluence.get_all_pages_from_space.assert_called_once()
+
+
+def test_get_all_pages_concurrent_batches_keep_order(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(
+        1037
+    )
+    confluence_client.confluence.cql.return_value["totalSize"] = 1037
+    pages = confluence_client.get_all_pages_by_space(
+        "TEST", batch_size=100, max_workers=4
+    )
+    assert [page["id"] for page in pages] == [str(i) for i in range(1037)]
+
+
+def test_get_all_pages_confirms_end_at_known_page_count(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(
+        1000
+    )
+    confluence_client.confluence.cql.return_value["totalSize"] = 1000
+    pages = confluence_client.get_all_pages_by_space(
+        "TEST", batch_size=100, max_workers=8
+    )
+    assert len(pages) == 1000
+    assert confluence_client.confluence.get_all_pages_from_space.call_count == 11
+
+
+def test_get_all_pages_not_truncated_by_stale_page_count(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(
+        1037
+    )
+    confluence_client.confluence.cql.return_value["totalSize"] = 500
+    pages = confluence_client.get_all_pages_by_space(
+        "TEST", batch_size=100, max_workers=4
+    )
+    assert [page["id"] for page in pages] == [str(i) for i in range(1037)]
+
+    # The listing disagrees with the count, so it must not be cached
+    calls = confluence_client.confluence.get_all_pages_from_space.call_count
+    confluence_client.get_all_pages_by_space("TEST", batch_size=100, max_workers=4)
+    assert confluence_client.confluence.get_all_pages_from_space.call_count > calls
+
+
+def test_get_all_pages_default_batch_needs_two_requests(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(
+        1037
+    )
+    confluence_client.confluence.cql.return_value["totalSize"] = 1037
+    pages = confluence_client.get_all_pages_by_space("TEST")
+    assert len(pages) == 1037
+    assert confluence_client.confluence.get_all_pages_from_space.call_count == 2
+
+
+def test_get_all_pages_adapts_to_server_page_limit(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(
+        1037, server_limit=200
+    )
+    pages = confluence_client.get_all_pages_by_space("TEST", use_cache=False)
+    assert [page["id"] for page in pages] == [str(i) for i in range(1037)]
+    calls = confluence_client.confluence.get_all_pages_from_space.call_args_list
+    assert calls[0].kwargs["limit"] == 1000
+    assert calls[-1].kwargs["limit"] == 200
+
+
+def test_get_all_pages_short_first_batch_confirms_end(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(150)
+    pages = confluence_client.get_all_pages_by_space("TEST", use_cache=False)
+    assert len(pages) == 150
+    assert confluence_client.confluence.get_all_pages_from_space.call_count == 2
+
+
+def test_get_all_pages_failure(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = Exception(
+        "Request failed"
+    )
+    with pytest.raises(PlatformError) as exc_info:
+        confluence_client.get_all_pages_by_space("TEST")
+    assert "Failed to get all pages for space TEST" in str(exc_info.value)
+
+
+def test_get_all_pages_served_from_cache_while_space_unchanged(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(30)
+    first = confluence_client.get_all_pages_by_space("TEST")
+    second = confluence_client.get_all_pages_by_space("TEST")
+    assert second == first
+    confluence_client.confluence.get_all_pages_from_space.assert_called_once()
+
+
+def test_get_all_pages_refetched_when_space_changes(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(30)
+    confluence_client.get_all_pages_by_space("TEST")
+    confluence_client.confluence.cql.return_value = {
+        "totalSize": 30,
+        "results": [{"content": {"id": "7"}, "lastModified": "2024-05-02"}],
+    }
+    confluence_client.get_all_pages_by_space("TEST")
+    assert confluence_client.confluence.get_all_pages_from_space.call_count == 2
+
+
+def test_get_all_pages_without_cache(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(30)
+    confluence_client.get_all_pages_by_space("TEST", use_cache=False)
+    confluence_client.get_all_pages_by_space("TEST", use_cache=False)
+    assert confluence_client.confluence.get_all_pages_from_space.call_count == 2
+    confluence_client.confluence.cql.assert_not_called()
+
+
+def test_iter_space_content_partial_read_is_not_cached(confluence_client):
+    confluence_client.confluence.get_space_content.return_value = {
+        "page": {"results": make_pages(0, 30)}
+    }
+    pages = confluence_client.iter_space_content("TEST")
+    next(pages)
+    pages.close()
+    list(confluence_client.iter_space_content("TEST"))
+    assert confluence_client.confluence.get_space_content.call_count == 2
+
+
+def test_get_page_by_title_reuses_recent_page(confluence_client):
+    confluence_client.confluence.get_page_by_title.return_value = {
+        "id": "1",
+        "title": "Home",
+    }
+    first = confluence_client.get_page_by_title("TEST", "Home")
+    assert confluence_client.get_page_by_title("TEST", "Home") == first
+    confluence_client.confluence.get_page_by_title.assert_called_once()
+
+    confluence_client.clear_cache()
+    confluence_client.get_page_by_title("TEST", "Home")
+    confluence_client.get_page_by_title("TEST", "Home", use_cache=False)
+    assert confluence_client.confluence.get_page_by_title.call_count == 3
+
+
+def test_get_all_pages_does_not_fetch_bodies_by_default(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(30)
+    confluence_client.get_all_pages_by_space("TEST", use_cache=False)
+    call = confluence_client.confluence.get_all_pages_from_space.call_args
+    assert call.kwargs["expand"] == "version"
+
+
+def test_get_child_pages_bulk_groups_by_parent(confluence_client):
+    def child(page_id, parent_id):
+        return {
+            "content": {
+                "id": page_id,
+                "title": f"Page {page_id}",
+                "ancestors": [{"id": "1"}, {"id": parent_id}],
+            }
+        }
+
+    confluence_client.confluence.cql.return_value = {
+        "results": [child("11", "10"), child("21", "20"), child("12", "10")],
+        "totalSize": 3,
+    }
+
+    children = confluence_client.get_child_pages_bulk(["10", "20", "30"])
+
+    assert [page["id"] for page in children["10"]] == ["11", "12"]
+    assert [page["id"] for page in children["20"]] == ["21"]
+    assert children["30"] == []
+    confluence_client.confluence.cql.assert_called_once_with(
+        "type = page and parent in (10, 20, 30)",
+        start=0,
+        limit=200,
+        expand="content.ancestors",
+    )
+
+
+def test_get_child_pages_bulk_rejects_invalid_ids(confluence_client):
+    with pytest.raises(PlatformError, match="Invalid page IDs"):
+        confluence_client.get_child_pages_bulk(["10) or (1=1"])
+    confluence_client.confluence.cql.assert_not_called()
+
+
+def test_get_all_pages_uses_shared_thread_pool(confluence_client):
+    threads = set()
+    fetch = paged_space(450)
+
+    def get_all_pages_from_space(space, start, limit, **kwargs):
+        if start:
+            threads.add(threading.current_thread().name)
+        return fetch(space, start, limit, **kwargs)
+
+    confluence_client.confluence.get_all_pages_from_space.side_effect = (
+        get_all_pages_from_space
+    )
+    for _ in range(2):
+        pages = confluence_client.get_all_pages_by_space(
+            "TEST", batch_size=100, use_cache=False
+        )
+        assert len(pages) == 450
+
+    assert threads and all(name.startswith("confluence") for name in threads)
+
+
+def test_space_fingerprint_escapes_space_key(confluence_client):
+    confluence_client._space_fingerprint('X" or space = "Y')
+    query = confluence_client.confluence.cql.call_args.args[0]
+    assert query.startswith('space = "X\\" or space = \\"Y" and type = page')
+
+
+def test_get_all_pages_fetched_when_fingerprint_fails(confluence_client):
+    confluence_client.confluence.get_all_pages_from_space.side_effect = paged_space(30)
+    confluence_client.confluence.cql.side_effect = requests.ConnectionError("down")
+    assert len(confluence_client.get_all_pages_by_space("TEST")) == 30
+    assert len(confluence_client.get_all_pages_by_space("TEST")) == 30
+    assert confluence_client.confluence.get_all_pages_from_space.call_count == 2
+
+
+def test_iter_space_content_partial_depth_skips_fingerprint(confluence_client):
+    confluence_client.confluence.get_space_content.return_value = {
+        "page": {"results": make_pages(0, 3)}
+    }
+    pages = [*confluence_client.iter_space_content("TEST", depth="root")]
+    assert len(pages) == 3
+    confluence_client.confluence.cql.assert_not_called()
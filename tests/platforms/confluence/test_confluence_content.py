@@ -0,0 +1,29 @@
+from conduit.platforms.confluence.content import (
+    ConfluenceContentCleaner,
+    format_markdown,
+)
+
+
+def test_format_markdown_table():
+    text = "Name|Role\n---------\n Ada |  Engineer \n\nAfter"
+    lines = format_markdown(text).split("\n")
+    assert lines[0] == "| Name | Role |"
+    assert lines[1].startswith("| --- |")
+    assert lines[2:] == ["| Ada | Engineer |", "", "", "After"]
+
+
+def test_format_markdown_headings_are_spaced():
+    assert format_markdown("Intro\n**Section**\nBody") == "Intro\n\n**Section**\n\nBody"
+
+
+def test_format_markdown_plain_text_unchanged():
+    text = "First line\n\nSecond line"
+    assert format_markdown(text) == text
+
+
+def test_clean_post_process_collapses_whitespace_and_spaces_headings():
+    text = "Intro   text\n \n\n\nMore\n## Heading"
+    assert (
+        ConfluenceContentCleaner()._post_process(text)
+        == "Intro text\n\nMore\n\n## Heading"
+    )
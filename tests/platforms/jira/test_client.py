@@ -1,23 +1,35 @@
+import subprocess
+import sys
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch
+from conduit.core.config import JiraConfig, SiteConfig
 from conduit.platforms.jira.client import JiraClient
 from conduit.core.exceptions import PlatformError
 
+CONFIG = SimpleNamespace(
+    jira=JiraConfig(
+        sites={
+            "default": SiteConfig(
+                url="https://example.atlassian.net",
+                email="test@example.com",
+                api_token="dummy_token",
+            )
+        }
+    )
+)
+
 
 @pytest.fixture
-def mock_config():
-    with patch("conduit.platforms.jira.client.load_config") as mock:
-        site_config = MagicMock()
-        site_config.url = "https://example.atlassian.net"
-        site_config.email = "test@example.com"
-        site_config.api_token = "dummy_token"
-        mock.return_value.jira.get_site_config.return_value = site_config
-        yield mock
+def mock_config(monkeypatch):
+    monkeypatch.setattr("conduit.platforms.jira.client.load_config", lambda: CONFIG)
+    return CONFIG
 
 
 @pytest.fixture
 def mock_jira():
-    with patch("conduit.platforms.jira.client.Jira") as mock:
+    with patch("atlassian.Jira") as mock:
         instance = mock.return_value
         instance.issue.return_value.raw = {"key": "TEST-1", "fields": {}}
         instance.jql.return_value = {
@@ -38,23 +50,17 @@ def jira_client(mock_config, mock_jira):
     return client
 
 
-def test_connect_success():
-    with patch("conduit.platforms.jira.client.load_config") as mock_config:
-        site_config = MagicMock()
-        site_config.url = "https://example.atlassian.net"
-        site_config.email = "test@example.com"
-        site_config.api_token = "dummy_token"
-        mock_config.return_value.jira.get_site_config.return_value = site_config
-
-        with patch("conduit.platforms.jira.client.Jira") as mock_jira_class:
-            client = JiraClient()
-            client.connect()
-            mock_jira_class.assert_called_once_with(
-                url="https://example.atlassian.net",
-                username="test@example.com",
-                password="dummy_token",
-                cloud=True,
-            )
+def test_connect_success(mock_config):
+    with patch("atlassian.Jira") as mock_jira_class:
+        client = JiraClient()
+        client.connect()
+        mock_jira_class.assert_called_once_with(
+            url="https://example.atlassian.net",
+            username="test@example.com",
+            password="dummy_token",
+            cloud=True,
+            session=ANY,
+        )
 
 
 def test_get_issue_success(jira_client):
@@ -67,7 +73,79 @@ def test_search_issues_success(jira_client):
     results = jira_client.search("project=TEST")
     assert len(results) == 1
     assert results[0]["key"] == "TEST-1"
-    jira_client.jira.jql.assert_called_once_with("project=TEST")
+    jira_client.jira.jql.assert_called_once_with("project=TEST", start=0, limit=500)
+
+
+def test_search_issues_with_fields_and_paging(jira_client):
+    jira_client.search(
+        "project=TEST", fields=["key", "summary", "status"], start=50, limit=25
+    )
+    jira_client.jira.jql.assert_called_once_with(
+        "project=TEST", fields="key,summary,status", start=50, limit=25
+    )
+
+
+def paged_search(total, server_limit=None):
+    """Build a jql side effect serving total issues, optionally capping page size."""
+
+    def jql(query, start=0, limit=50, **kwargs):
+        if server_limit:
+            limit = min(limit, server_limit)
+        end = min(start + limit, total)
+        return {
+            "startAt": start,
+            "total": total,
+            "issues": [{"key": f"TEST-{i}"} for i in range(start, end)],
+        }
+
+    return jql
+
+
+def test_search_issues_fetches_all_pages(jira_client):
+    jira_client.jira.jql.side_effect = paged_search(1200)
+
+    results = jira_client.search("project=TEST")
+
+    assert [issue["key"] for issue in results] == [f"TEST-{i}" for i in range(1200)]
+    assert [c.kwargs["start"] for c in jira_client.jira.jql.call_args_list] == [
+        0,
+        500,
+        1000,
+    ]
+
+
+def test_search_issues_concurrent_pages_keep_order(jira_client):
+    jira_client.jira.jql.side_effect = paged_search(1037)
+
+    results = jira_client.search("project=TEST", batch_size=100, max_workers=4)
+
+    assert [issue["key"] for issue in results] == [f"TEST-{i}" for i in range(1037)]
+    assert jira_client.jira.jql.call_count == 11
+
+
+def test_search_issues_adapts_to_server_page_cap(jira_client):
+    jira_client.jira.jql.side_effect = paged_search(250, server_limit=100)
+
+    results = jira_client.search("project=TEST")
+
+    assert len(results) == 250
+    assert [c.kwargs["limit"] for c in jira_client.jira.jql.call_args_list] == [
+        500,
+        100,
+        50,
+    ]
+
+
+def test_search_issues_stops_at_limit(jira_client):
+    jira_client.jira.jql.side_effect = paged_search(1200)
+
+    results = jira_client.search("project=TEST", limit=600)
+
+    assert len(results) == 600
+    assert [c.kwargs["limit"] for c in jira_client.jira.jql.call_args_list] == [
+        500,
+        100,
+    ]
 
 
 def test_create_issue_failure(jira_client):
@@ -101,7 +179,10 @@ def test_transition_status_success(jira_client):
         {"id": "31", "name": "Done"},
     ]
     jira_client.transition_status("TEST-1", "In Progress")
-    jira_client.jira.set_issue_status.assert_called_with("TEST-1", "In Progress")
+    jira_client.jira.set_issue_status_by_transition_id.assert_called_once_with(
+        "TEST-1", "21"
+    )
+    jira_client.jira.get_issue_transitions.assert_called_once_with("TEST-1")
 
 
 def test_transition_status_invalid_status(jira_client):
@@ -114,7 +195,30 @@ def test_transition_status_invalid_status(jira_client):
     }
     with pytest.raises(PlatformError) as exc_info:
         jira_client.transition_status("TEST-1", "Invalid Status")
-    assert "string indices must be integers" in str(exc_info.value)
+    assert "Failed to transition issue TEST-1 to status 'Invalid Status'" in str(
+        exc_info.value
+    )
+
+
+def test_transition_status_matches_target_status(jira_client):
+    jira_client.jira.get_issue_transitions.return_value = [
+        {"id": 11, "name": "Start work", "to": "In Progress"},
+        {"id": 21, "name": "Finish", "to": "Done"},
+    ]
+    jira_client.transition_status("TEST-1", "done")
+    jira_client.jira.set_issue_status_by_transition_id.assert_called_once_with(
+        "TEST-1", 21
+    )
+
+
+def test_transition_status_unavailable_status(jira_client):
+    jira_client.jira.get_issue_transitions.return_value = [
+        {"id": 11, "name": "Start work", "to": "In Progress"},
+    ]
+    with pytest.raises(PlatformError) as exc_info:
+        jira_client.transition_status("TEST-1", "Done")
+    assert "Available statuses: In Progress" in str(exc_info.value)
+    jira_client.jira.set_issue_status_by_transition_id.assert_not_called()
 
 
 def test_transition_status_failure(jira_client):
@@ -124,9 +228,167 @@ def test_transition_status_failure(jira_client):
         {"id": "21", "name": "In Progress"},
         {"id": "31", "name": "Done"},
     ]
-    jira_client.jira.set_issue_status.side_effect = Exception("Transition failed")
+    jira_client.jira.set_issue_status_by_transition_id.side_effect = Exception(
+        "Transition failed"
+    )
     with pytest.raises(PlatformError) as exc_info:
         jira_client.transition_status("TEST-1", "In Progress")
     assert "Failed to transition issue TEST-1 to status 'In Progress'" in str(
         exc_info.value
     )
+
+
+def test_get_issue_uses_cache(jira_client):
+    jira_client.get("TEST-1")
+    jira_client.get("TEST-1")
+    jira_client.jira.issue.assert_called_once_with("TEST-1")
+
+    jira_client.get("TEST-1", use_cache=False)
+    assert jira_client.jira.issue.call_count == 2
+
+
+def test_update_issue_invalidates_cache(jira_client):
+    jira_client.get("TEST-1")
+    jira_client.get_transitions("TEST-1")
+    jira_client.update("TEST-1", summary="Updated Summary")
+    jira_client.get("TEST-1")
+    jira_client.get_transitions("TEST-1")
+
+    assert jira_client.jira.issue.call_count == 2
+    assert jira_client.jira.get_issue_transitions.call_count == 2
+
+
+def test_add_issues_to_sprint_invalidates_cache(jira_client):
+    jira_client.get("TEST-1")
+    jira_client.add_issues_to_sprint(7, ["TEST-1"])
+    jira_client.get("TEST-1")
+
+    jira_client.jira.add_issues_to_sprint.assert_called_once_with(7, ["TEST-1"])
+    assert jira_client.jira.issue.call_count == 2
+
+
+def test_get_issue_returns_independent_copies(jira_client):
+    jira_client.get("TEST-1")["fields"]["summary"] = "Changed"
+
+    assert jira_client.get("TEST-1")["fields"] == {}
+
+
+def test_get_remote_links_uses_cache(jira_client):
+    jira_client.jira.get_issue_remote_links.return_value = [{"id": 1}]
+    assert jira_client.get_remote_links("TEST-1") == [{"id": 1}]
+    assert jira_client.get_remote_links("TEST-1") == [{"id": 1}]
+    jira_client.jira.get_issue_remote_links.assert_called_once_with("TEST-1")
+
+    jira_client.clear_cache()
+    jira_client.get_remote_links("TEST-1")
+    assert jira_client.jira.get_issue_remote_links.call_count == 2
+
+
+def test_create_many_sends_chunks_of_fifty(jira_client):
+    def create_issues(chunk):
+        start = jira_client.jira.create_issues.call_count * 50
+        return {
+            "issues": [{"key": f"TEST-{start + i}"} for i in range(len(chunk))],
+            "errors": [],
+        }
+
+    jira_client.jira.create_issues.side_effect = create_issues
+    issues = [
+        {"project": {"key": "TEST"}, "summary": f"Issue {i}", "description": "# Title"}
+        for i in range(120)
+    ]
+
+    created = jira_client.create_many(issues)
+
+    assert len(created) == 120
+    assert [len(c.args[0]) for c in jira_client.jira.create_issues.call_args_list] == [
+        50,
+        50,
+        20,
+    ]
+    first = jira_client.jira.create_issues.call_args_list[0].args[0][0]["fields"]
+    assert first["issuetype"] == {"name": "Task"}
+    assert first["description"] == "h1. Title"
+
+
+def test_create_many_reports_created_issues_on_failure(jira_client):
+    jira_client.jira.create_issues.side_effect = [
+        {"issues": [{"key": "TEST-1"}], "errors": []},
+        Exception("Bad request"),
+    ]
+    issues = [{"project": {"key": "TEST"}, "summary": "Issue"}] * 51
+
+    with pytest.raises(PlatformError, match="created before failure: TEST-1"):
+        jira_client.create_many(issues)
+
+
+def test_update_many_reports_failed_issues(jira_client):
+    def issue_update(key, fields):
+        if key == "TEST-2":
+            raise Exception("Issue does not exist")
+
+    jira_client.jira.issue_update.side_effect = issue_update
+
+    with pytest.raises(PlatformError) as exc_info:
+        jira_client.update_many(
+            {"TEST-1": {"summary": "One"}, "TEST-2": {"summary": "Two"}}
+        )
+    assert "Failed to update issue TEST-2" in str(exc_info.value)
+    assert jira_client.jira.issue_update.call_count == 2
+
+
+def test_create_issue_reuses_site_config(jira_client):
+    jira_client.jira.issue_create.return_value = {"key": "TEST-2"}
+    # create() must not look the site up again after connect()
+    jira_client.config = None
+
+    result = jira_client.create(project={"key": "TEST"}, summary="New issue")
+
+    assert result == {"key": "TEST-2"}
+    assert jira_client.site_config.url == "https://example.atlassian.net"
+
+
+def test_transition_status_reuses_cached_transitions(jira_client):
+    jira_client.get_transitions("TEST-1")
+    jira_client.transition_status("TEST-1", "Done")
+
+    jira_client.jira.get_issue_transitions.assert_called_once_with("TEST-1")
+    jira_client.jira.set_issue_status_by_transition_id.assert_called_once_with(
+        "TEST-1", "31"
+    )
+
+
+def test_transition_status_refetches_stale_transitions(jira_client):
+    jira_client.get_transitions("TEST-1")
+    jira_client.jira.set_issue_status_by_transition_id.side_effect = [
+        Exception("Transition is not valid"),
+        None,
+    ]
+    jira_client.jira.get_issue_transitions.return_value = [
+        {"id": "41", "name": "Done"},
+    ]
+
+    jira_client.transition_status("TEST-1", "Done")
+
+    assert jira_client.jira.get_issue_transitions.call_count == 2
+    jira_client.jira.set_issue_status_by_transition_id.assert_called_with(
+        "TEST-1", "41"
+    )
+
+
+def test_import_does_not_load_atlassian():
+    code = (
+        "import sys, conduit.platforms.jira.client; "
+        "print('atlassian' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_update_skips_issues_without_changes(jira_client):
+    jira_client.update("TEST-1", summary=None, description=None)
+    jira_client.update_many({"TEST-1": {"summary": None}, "TEST-2": {"summary": "Two"}})
+
+    jira_client.jira.issue_update.assert_called_once_with("TEST-2", {"summary": "Two"})
@@ -0,0 +1,18 @@
+from conduit.platforms.jira.content import markdown_to_jira
+
+
+def test_markdown_to_jira_converts_common_elements():
+    content = "# Title\n## Section\n- item\nUse `code` here"
+
+    assert markdown_to_jira(content) == (
+        "h1. Title\nh2. Section\n* item\nUse {{code}} here"
+    )
+
+
+def test_markdown_to_jira_memoizes_conversions():
+    markdown_to_jira.cache_clear()
+
+    markdown_to_jira("# Template")
+    markdown_to_jira("# Template")
+
+    assert markdown_to_jira.cache_info().hits == 1
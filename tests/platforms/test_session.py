@@ -0,0 +1,37 @@
+import pytest
+import requests
+
+from conduit.platforms.session import POOL_MAXSIZE, create_session
+
+
+def test_create_session_mounts_pooled_adapter():
+    session = create_session()
+
+    adapter = session.get_adapter("https://example.atlassian.net/rest/api/2")
+    assert adapter._pool_maxsize == POOL_MAXSIZE
+
+
+def test_create_session_pool_size_is_configurable():
+    session = create_session(pool_maxsize=4)
+
+    assert session.get_adapter("https://example.com")._pool_maxsize == 4
+
+
+def test_create_session_retries_idempotent_requests_only():
+    retries = create_session().get_adapter("https://example.com").max_retries
+
+    assert 429 in retries.status_forcelist
+    assert retries.is_retry("GET", 503)
+    assert not retries.is_retry("POST", 503)
+
+
+def test_create_session_decodes_json_with_orjson():
+    pytest.importorskip("orjson")
+    session = create_session()
+    response = requests.Response()
+    response._content = b'{"issues": [{"key": "TEST-1"}], "total": 1}'
+
+    for hook in session.hooks["response"]:
+        response = hook(response)
+
+    assert response.json() == {"issues": [{"key": "TEST-1"}], "total": 1}